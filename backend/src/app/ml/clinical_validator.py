@@ -20,11 +20,7 @@ from ..utils.sofa_scoring import (
     calculate_respiratory_score, calculate_coagulation_score, calculate_liver_score,
     calculate_cardiovascular_score, calculate_cns_score, calculate_renal_score
 )
-from ..utils.qsofa_scoring import (
-    calculate_respiratory_score as qsofa_respiratory_score,
-    calculate_cardiovascular_score as qsofa_cardiovascular_score, 
-    calculate_cns_score as qsofa_cns_score
-)
+from ..utils.qsofa_scoring import calculate_qsofa_total_score
 from ..utils.news2_scoring import (
     calculate_respiratory_rate_score, calculate_oxygen_saturation_score,
     calculate_supplemental_oxygen_score, calculate_temperature_score,
@@ -156,16 +152,8 @@ class ClinicalScoreValidator:
         altered_mental_status = gcs is not None and gcs < 15
         
         try:
-            # Calculate individual component scores using production functions
-            respiratory_score = qsofa_respiratory_score(respiratory_rate)
-            cardiovascular_score = qsofa_cardiovascular_score(systolic_bp)
-            cns_score = qsofa_cns_score(altered_mental_status, gcs)
-            
-            # Return total qSOFA score
-            total_score = (respiratory_score.score + cardiovascular_score.score + 
-                         cns_score.score)
-            
-            return total_score
+            # Only the total is needed, so skip building component score objects
+            return calculate_qsofa_total_score(respiratory_rate, systolic_bp, altered_mental_status)
             
         except Exception as e:
             self.logger.warning(f"Error calculating qSOFA score: {str(e)}")
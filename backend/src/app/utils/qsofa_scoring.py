@@ -101,21 +101,64 @@ def _assess_mental_status_simple(gcs_param: QsofaParameter) -> bool:
     Returns:
         True if altered mental status detected (GCS < 15)
     """
-    if gcs_param.value is not None and gcs_param.value < QsofaThresholds.GCS_THRESHOLD:
+    if gcs_param.value is not None and _gcs_altered(gcs_param.value):
         logger.debug("Altered mental status detected: GCS below threshold")
         return True
     return False
 
 # Removed: Old complex parameter handling replaced by shared utilities
 
+# Threshold predicates shared by the component scores. They only use comparison
+# operators, so they also apply elementwise to numpy arrays of readings.
+
+def _respiratory_threshold_met(respiratory_rate):
+    """Respiratory rate at or above the qSOFA threshold (≥22 breaths/min)"""
+    return respiratory_rate >= QsofaThresholds.RESPIRATORY_RATE_THRESHOLD
+
+def _systolic_bp_threshold_met(systolic_bp):
+    """Systolic BP at or below the qSOFA threshold (≤100 mmHg)"""
+    return systolic_bp <= QsofaThresholds.SYSTOLIC_BP_THRESHOLD
+
+def _gcs_altered(gcs):
+    """GCS below 15, i.e. altered mental status"""
+    return gcs < QsofaThresholds.GCS_THRESHOLD
+
+# Integer-only component scores, for callers that need the points but not the
+# interpretation text or QsofaComponentScore objects
+
+def _respiratory_score(respiratory_rate: Optional[float]) -> int:
+    if respiratory_rate is None:
+        respiratory_rate = QsofaDefaults.RESPIRATORY_RATE
+    return int(_respiratory_threshold_met(respiratory_rate))
+
+def _cardiovascular_score(systolic_bp: Optional[float]) -> int:
+    if systolic_bp is None:
+        systolic_bp = QsofaDefaults.SYSTOLIC_BP
+    return int(_systolic_bp_threshold_met(systolic_bp))
+
+def _cns_score(altered_mental_status: bool) -> int:
+    return 1 if altered_mental_status else 0
+
+def calculate_qsofa_total_score(
+    respiratory_rate: Optional[float],
+    systolic_bp: Optional[float],
+    altered_mental_status: bool
+) -> int:
+    """Calculate the qSOFA total (0-3) without building component score objects"""
+    return (
+        _respiratory_score(respiratory_rate) +
+        _cardiovascular_score(systolic_bp) +
+        _cns_score(altered_mental_status)
+    )
+
 def calculate_respiratory_score(respiratory_rate: Optional[float]) -> QsofaComponentScore:
     """Calculate qSOFA respiratory score based on respiratory rate"""
     
     if respiratory_rate is None:
         respiratory_rate = QsofaDefaults.RESPIRATORY_RATE
     
-    threshold_met = respiratory_rate >= QsofaThresholds.RESPIRATORY_RATE_THRESHOLD
-    score = 1 if threshold_met else 0
+    score = _respiratory_score(respiratory_rate)
+    threshold_met = score == 1
     
     interpretation = f"Respiratory rate: {respiratory_rate:.0f} breaths/min"
     if threshold_met:
@@ -132,8 +175,8 @@ def calculate_cardiovascular_score(systolic_bp: Optional[float]) -> QsofaCompone
     if systolic_bp is None:
         systolic_bp = QsofaDefaults.SYSTOLIC_BP
     
-    threshold_met = systolic_bp <= QsofaThresholds.SYSTOLIC_BP_THRESHOLD
-    score = 1 if threshold_met else 0
+    score = _cardiovascular_score(systolic_bp)
+    threshold_met = score == 1
     
     interpretation = f"Systolic BP: {systolic_bp:.0f} mmHg"
     if threshold_met:
@@ -147,7 +190,7 @@ def calculate_cardiovascular_score(systolic_bp: Optional[float]) -> QsofaCompone
 def calculate_cns_score(altered_mental_status: bool, gcs: Optional[float] = None) -> QsofaComponentScore:
     """Calculate qSOFA central nervous system score based on altered mental status"""
     
-    score = 1 if altered_mental_status else 0
+    score = _cns_score(altered_mental_status)
     
     interpretation = "Mental status: "
     if altered_mental_status:
@@ -1,8 +1,10 @@
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from app.models.sofa import (
     SofaParameters, SofaParameter, VasopressorDoses, SofaComponentScore, 
     SofaScoreResult, SofaScoreResponse
@@ -225,18 +227,13 @@ def calculate_coagulation_score(platelets: Optional[float]) -> SofaComponentScor
     if platelets is None:
         platelets = SofaDefaults.PLATELETS
     
-    # Apply SOFA scoring criteria using thresholds
+    # Each threshold crossed adds one point; the checks are negated so a NaN
+    # count fails all of them and scores 4, as an if/elif ladder would
     thresholds = SofaThresholds.COAGULATION
-    if platelets >= thresholds["normal"]:
-        score = 0
-    elif platelets >= thresholds["mild"]:
-        score = 1
-    elif platelets >= thresholds["moderate"]:
-        score = 2
-    elif platelets >= thresholds["severe"]:
-        score = 3
-    else:
-        score = 4
+    score = int(
+        (not platelets >= thresholds["normal"]) + (not platelets >= thresholds["mild"])
+        + (not platelets >= thresholds["moderate"]) + (not platelets >= thresholds["severe"])
+    )
     
     return SofaComponentScore(
         organ_system="Coagulation",
@@ -251,18 +248,13 @@ def calculate_liver_score(bilirubin: Optional[float]) -> SofaComponentScore:
     if bilirubin is None:
         bilirubin = SofaDefaults.BILIRUBIN
     
-    # Apply SOFA scoring criteria using thresholds
+    # Each threshold reached adds one point; the checks are negated so a NaN
+    # level fails all of them and scores 4, as an if/elif ladder would
     thresholds = SofaThresholds.LIVER
-    if bilirubin < thresholds["normal"]:
-        score = 0
-    elif bilirubin < thresholds["mild"]:
-        score = 1
-    elif bilirubin < thresholds["moderate"]:
-        score = 2
-    elif bilirubin < thresholds["severe"]:
-        score = 3
-    else:
-        score = 4
+    score = int(
+        (not bilirubin < thresholds["normal"]) + (not bilirubin < thresholds["mild"])
+        + (not bilirubin < thresholds["moderate"]) + (not bilirubin < thresholds["severe"])
+    )
     
     return SofaComponentScore(
         organ_system="Liver",
@@ -349,18 +341,12 @@ def calculate_renal_score(creatinine: Optional[float], urine_output_24h: Optiona
     if urine_output_24h is None:
         urine_output_24h = SofaDefaults.URINE_OUTPUT
     
-    # Check creatinine levels using thresholds
+    # Check creatinine levels using thresholds; negated so a NaN level scores 4
     creat_thresholds = SofaThresholds.RENAL["creatinine"]
-    if creatinine < creat_thresholds["normal"]:
-        creatinine_score = 0
-    elif creatinine < creat_thresholds["mild"]:
-        creatinine_score = 1
-    elif creatinine < creat_thresholds["moderate"]:
-        creatinine_score = 2
-    elif creatinine < creat_thresholds["severe"]:
-        creatinine_score = 3
-    else:
-        creatinine_score = 4
+    creatinine_score = int(
+        (not creatinine < creat_thresholds["normal"]) + (not creatinine < creat_thresholds["mild"])
+        + (not creatinine < creat_thresholds["moderate"]) + (not creatinine < creat_thresholds["severe"])
+    )
     
     # Check urine output using thresholds
     urine_thresholds = SofaThresholds.RENAL["urine_output"]
@@ -409,6 +395,24 @@ async def calculate_total_sofa(
     # Collect parameters
     parameters = await collect_sofa_parameters(patient_id, fhir_client, timestamp)
     
+    return calculate_sofa_from_parameters(parameters, patient_id, timestamp)
+
+def calculate_sofa_from_parameters(
+    parameters: SofaParameters,
+    patient_id: str,
+    timestamp: datetime
+) -> SofaScoreResult:
+    """
+    Calculate a SOFA score result from already collected parameters
+    
+    Args:
+        parameters: Collected SOFA parameters
+        patient_id: Patient FHIR ID
+        timestamp: Timestamp of the calculation
+    
+    Returns:
+        Complete SOFA score result
+    """
     # Calculate individual organ scores
     respiratory_score = calculate_respiratory_score(
         parameters.pao2.value,
@@ -458,6 +462,163 @@ async def calculate_total_sofa(
     logger.info(f"SOFA score calculated: {total_score}/24, reliability: {reliability_score:.2f}")
     return result
 
+# Batch scoring: the same criteria as the calculate_*_score functions, applied
+# with numpy to many patients at once. Missing lab and GCS readings (None) are
+# replaced by the same defaults as the scalar path when the columns are built;
+# a NaN reading is kept and scores like the scalar ladders do. Missing PaO2,
+# FiO2, MAP and vasopressor doses are NaN. Monotone threshold ladders are lookup
+# tables: np.searchsorted(thresholds, values, side="right") counts how many
+# ascending thresholds each value reaches, and that count indexes the scores.
+
+SOFA_BATCH_ORGAN_SYSTEMS = (
+    "Respiratory", "Coagulation", "Liver", "Cardiovascular", "Central Nervous System", "Renal"
+)
+
+_RESPIRATORY_THRESHOLDS = np.array(
+    [SofaThresholds.RESPIRATORY[tier] for tier in ("severe", "moderate", "mild", "normal")]
+)
+_RESPIRATORY_SCORES_VENTILATED = np.array([4, 3, 2, 1, 0])
+_RESPIRATORY_SCORES_UNVENTILATED = np.array([0, 0, 2, 1, 0])  # <200 scores 3-4 only on ventilation
+_COAGULATION_THRESHOLDS = np.array(
+    [SofaThresholds.COAGULATION[tier] for tier in ("severe", "moderate", "mild", "normal")]
+)
+_COAGULATION_SCORES = np.array([4, 3, 2, 1, 0])
+_LIVER_THRESHOLDS = np.array([SofaThresholds.LIVER[tier] for tier in ("normal", "mild", "moderate", "severe")])
+_LIVER_SCORES = np.array([0, 1, 2, 3, 4])
+_CNS_THRESHOLDS = np.array([SofaThresholds.CNS[tier] for tier in ("severe", "moderate", "mild", "normal")])
+_CNS_SCORES = np.array([4, 3, 2, 1, 0])
+_CREATININE_THRESHOLDS = np.array(
+    [SofaThresholds.RENAL["creatinine"][tier] for tier in ("normal", "mild", "moderate", "severe")]
+)
+_CREATININE_SCORES = np.array([0, 1, 2, 3, 4])
+_URINE_OUTPUT_THRESHOLDS = np.array([SofaThresholds.RENAL["urine_output"][tier] for tier in ("oliguria", "normal")])
+_URINE_OUTPUT_SCORES = np.array([4, 3, 0])
+
+def _float_column(values, default: float = np.nan) -> np.ndarray:
+    """Stack optional floats into a float array, with None as ``default``"""
+    return np.array([default if value is None else value for value in values], dtype=float)
+
+def _with_default(values: np.ndarray, default: float) -> np.ndarray:
+    return np.where(np.isnan(values), default, values)
+
+def _lookup(thresholds: np.ndarray, scores: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return scores[np.searchsorted(thresholds, values, side="right")]
+
+def calculate_respiratory_score_batch(pao2: np.ndarray, fio2: np.ndarray, on_ventilation: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_respiratory_score; NaN marks a missing PaO2 or FiO2"""
+    pao2, fio2 = np.asarray(pao2, dtype=float), np.asarray(fio2, dtype=float)
+    pao2_given = ~np.isnan(pao2) & (pao2 != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(
+            pao2_given & (fio2 > 0), pao2 / fio2,
+            np.where(pao2_given & np.isnan(fio2), pao2 / SofaDefaults.ROOM_AIR_FIO2, SofaDefaults.PAO2_FIO2_RATIO)
+        )
+    tier = np.searchsorted(_RESPIRATORY_THRESHOLDS, ratio, side="right")
+    return np.where(
+        np.asarray(on_ventilation, dtype=bool),
+        _RESPIRATORY_SCORES_VENTILATED[tier],
+        _RESPIRATORY_SCORES_UNVENTILATED[tier]
+    )
+
+def calculate_coagulation_score_batch(platelets: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_coagulation_score; a NaN count fails every threshold and scores 4"""
+    platelets = np.asarray(platelets, dtype=float)
+    return np.where(np.isnan(platelets), 4, _lookup(_COAGULATION_THRESHOLDS, _COAGULATION_SCORES, platelets))
+
+def calculate_liver_score_batch(bilirubin: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_liver_score; NaN sorts past every threshold and scores 4"""
+    return _lookup(_LIVER_THRESHOLDS, _LIVER_SCORES, np.asarray(bilirubin, dtype=float))
+
+def calculate_cardiovascular_score_batch(map_value: np.ndarray, dopamine: np.ndarray, epinephrine: np.ndarray,
+                                         norepinephrine: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_cardiovascular_score; NaN marks a missing MAP or vasopressor dose"""
+    map_value = _with_default(np.asarray(map_value, dtype=float), SofaDefaults.MAP)
+    dopamine = np.asarray(dopamine, dtype=float)
+    epinephrine = np.asarray(epinephrine, dtype=float)
+    norepinephrine = np.asarray(norepinephrine, dtype=float)
+    thresholds = SofaThresholds.VASOPRESSOR
+    high_dose = (
+        (dopamine > thresholds["high_dopamine"]) |
+        (epinephrine > thresholds["epi_norepi"]) |
+        (norepinephrine > thresholds["epi_norepi"])
+    )
+    return np.select(
+        [high_dose, dopamine > thresholds["low_dopamine"], (dopamine != 0) & (dopamine <= thresholds["low_dopamine"]),
+         map_value < SofaThresholds.CARDIOVASCULAR["normal_map"]],
+        [4, 3, 2, 1],
+        default=0
+    )
+
+def calculate_cns_score_batch(gcs: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_cns_score; a NaN GCS fails every threshold and scores 4"""
+    gcs = np.asarray(gcs, dtype=float)
+    return np.where(np.isnan(gcs), 4, _lookup(_CNS_THRESHOLDS, _CNS_SCORES, gcs))
+
+def calculate_renal_score_batch(creatinine: np.ndarray, urine_output_24h: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_renal_score; a NaN creatinine scores 4, a NaN urine output 0, as in the scalar ladders"""
+    creatinine = np.asarray(creatinine, dtype=float)
+    urine_output_24h = np.asarray(urine_output_24h, dtype=float)
+    return np.maximum(
+        _lookup(_CREATININE_THRESHOLDS, _CREATININE_SCORES, creatinine),
+        _lookup(_URINE_OUTPUT_THRESHOLDS, _URINE_OUTPUT_SCORES, urine_output_24h)
+    )
+
+def calculate_organ_scores_batch(parameters_list: Sequence[SofaParameters]) -> np.ndarray:
+    """
+    Calculate SOFA organ scores for many patients in one vectorized pass
+    
+    Args:
+        parameters_list: Collected SOFA parameters, one per patient
+    
+    Returns:
+        Integer array of shape (n_patients, 6), columns in SOFA_BATCH_ORGAN_SYSTEMS order
+    """
+    doses = [parameters.vasopressor_doses for parameters in parameters_list]
+    return np.column_stack([
+        calculate_respiratory_score_batch(
+            _float_column(parameters.pao2.value for parameters in parameters_list),
+            _float_column(parameters.fio2.value for parameters in parameters_list),
+            np.array([bool(parameters.mechanical_ventilation) for parameters in parameters_list], dtype=bool)
+        ),
+        calculate_coagulation_score_batch(
+            _float_column((parameters.platelets.value for parameters in parameters_list), SofaDefaults.PLATELETS)
+        ),
+        calculate_liver_score_batch(
+            _float_column((parameters.bilirubin.value for parameters in parameters_list), SofaDefaults.BILIRUBIN)
+        ),
+        calculate_cardiovascular_score_batch(
+            _float_column(parameters.map_value.value for parameters in parameters_list),
+            _float_column(dose.dopamine for dose in doses),
+            _float_column(dose.epinephrine for dose in doses),
+            _float_column(dose.norepinephrine for dose in doses)
+        ),
+        calculate_cns_score_batch(
+            _float_column((parameters.gcs.value for parameters in parameters_list), SofaDefaults.GCS)
+        ),
+        calculate_renal_score_batch(
+            _float_column((parameters.creatinine.value for parameters in parameters_list), SofaDefaults.CREATININE),
+            _float_column(
+                (parameters.urine_output_24h.value for parameters in parameters_list), SofaDefaults.URINE_OUTPUT
+            )
+        ),
+    ])
+
+def calculate_total_sofa_batch(parameters_list: Sequence[SofaParameters]) -> np.ndarray:
+    """
+    Calculate total SOFA scores (0-24) for many patients in one vectorized pass
+    
+    Scores match calculate_sofa_from_parameters; use this when only the
+    numbers are needed, e.g. bulk scoring, since it builds no per-organ
+    SofaComponentScore objects or interpretation text.
+    
+    Args:
+        parameters_list: Collected SOFA parameters, one per patient
+    
+    Returns:
+        Integer array of shape (n_patients,)
+    """
+    return calculate_organ_scores_batch(parameters_list).sum(axis=1)
+
 # Helper functions for data collection
 # Note: Individual organ collection functions replaced with unified _collect_organ_parameters()
 
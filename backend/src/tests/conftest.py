@@ -3,30 +3,58 @@ Test configuration and shared fixtures for Sepsis AI Alert System tests.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
-from typing import Dict, Any, Optional
+import requests
+from unittest.mock import Mock, AsyncMock, create_autospec, patch
+from typing import Dict, Any
+from tenacity import retry_never
 from datetime import datetime
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 
 from app.main import app
 from app.services.fhir_client import FHIRClient
 from app.core.dependencies import get_fhir_client
 from app.core.exceptions import FHIRException
+from tests.fixtures.app_factory import create_orjson_app, create_routing_app
+from tests.fixtures.mock_backend import MockFHIRBackend, MockResponse
+from tests.fixtures.stub_fhir import StubFHIRClient
+# Session-scoped response model fixtures and factories, imported so pytest discovers them.
+from tests.fixtures.fhir_responses import (  # noqa: F401
+    sample_patient_response,
+    single_match_bundle,
+    empty_match_bundle,
+    three_match_bundle,
+    vital_sign_factory,
+    vitals_response_factory,
+    latest_vitals_factory,
+)
+from tests.fixtures.qsofa_test_data import qsofa_patients  # noqa: F401
+
+# uvloop is optional (no Windows support); fall back to the stdlib event loop without it
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Dependency overrides installed for the current test module; reset_dependency_overrides
+# restores these instead of clearing everything after each test.
+_MODULE_OVERRIDES: Dict[Any, Any] = {}
 
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create one event loop for the test session, using uvloop when it is installed."""
+    policy = uvloop.EventLoopPolicy() if uvloop is not None else asyncio.get_event_loop_policy()
+    loop = policy.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest.fixture
-def mock_fhir_client():
-    """Create a mock FHIR client with configurable responses."""
+def _make_mock_fhir_client():
+    """Build a FHIRClient mock whose request methods are AsyncMocks."""
     client = Mock(spec=FHIRClient)
     
     # Make all methods async mocks
@@ -46,30 +74,142 @@ def mock_fhir_client():
 
 
 @pytest.fixture
-def mock_fhir_client_dependency(mock_fhir_client):
-    """Override the FHIR client dependency with a mock."""
-    def _get_mock_fhir_client():
-        return mock_fhir_client
-    
-    app.dependency_overrides[get_fhir_client] = _get_mock_fhir_client
-    yield mock_fhir_client
-    app.dependency_overrides.clear()
+def mock_fhir_client():
+    """Create a mock FHIR client with configurable responses."""
+    return _make_mock_fhir_client()
 
 
 @pytest.fixture
-def test_client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+def mock_fhir_client_dependency(fastapi_dep, mock_fhir_client):
+    """Override the FHIR client dependency with a mock for the duration of a test."""
+    with fastapi_dep(app).override({get_fhir_client: lambda: mock_fhir_client}):
+        yield mock_fhir_client
 
 
 @pytest.fixture
-async def async_client(mock_fhir_client_dependency):
-    """Create an async test client for the FastAPI app."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
+def stub_fhir_client_dependency(fastapi_dep):
+    """Override the FHIR client dependency with a lightweight StubFHIRClient."""
+    stub = StubFHIRClient()
+    with fastapi_dep(app).override({get_fhir_client: lambda: stub}):
+        yield stub
+
+
+@pytest.fixture(scope="session")
+def test_client():
+    """Create a session-wide test client; entered once so app startup runs a single time."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Create a session-wide async test client that calls the ASGI app in-process."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="https://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def routing_client():
+    """
+    Session-wide async client for routing/param-parsing tests.
+
+    Targets a mirror of the app that skips response_model validation and
+    serializes with ORJSONResponse; contract tests should use async_client.
+    """
+    routing_app = create_routing_app(app)
+    async with AsyncClient(transport=ASGITransport(app=routing_app), base_url="https://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def orjson_client():
+    """
+    Session-wide async client for contract tests on an ORJSONResponse mirror of the app.
+
+    Responses are validated against each route's response_model exactly as
+    on the real app; only the JSON encoder differs.
+    """
+    orjson_app = create_orjson_app(app)
+    async with AsyncClient(transport=ASGITransport(app=orjson_app), base_url="https://test") as client:
         yield client
 
 
+@pytest_asyncio.fixture(scope="session")
+async def validation_client():
+    """
+    Session-wide async client for request-validation (422) tests.
+
+    The mirror app gets its own dependency_overrides dict, installed once, so
+    it is untouched by the per-test override reset. FastAPI resolves
+    dependencies before rejecting bad query params, so the FHIR client is
+    replaced with an unconfigured StubFHIRClient: a request that got past
+    validation would fail instead of reaching a real FHIR server.
+    """
+    validation_app = create_orjson_app(app)
+    validation_app.dependency_overrides = {get_fhir_client: StubFHIRClient}
+    async with AsyncClient(transport=ASGITransport(app=validation_app), base_url="https://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def module_fhir_stub():
+    """
+    StubFHIRClient installed as the get_fhir_client override for one test module.
+
+    Tests use it through ``module_stub_fhir_client``, which resets it after
+    each test. The override is removed at module teardown, so modules that do not
+    request it never see the stub.
+    """
+    stub = StubFHIRClient()
+    _MODULE_OVERRIDES[get_fhir_client] = lambda: stub
+    app.dependency_overrides.update(_MODULE_OVERRIDES)
+    yield stub
+    _MODULE_OVERRIDES.pop(get_fhir_client, None)
+    app.dependency_overrides.pop(get_fhir_client, None)
+
+
 @pytest.fixture
+def module_stub_fhir_client(module_fhir_stub):
+    """
+    The module-wide StubFHIRClient, reset after each test.
+
+    Unlike ``stub_fhir_client_dependency``, which installs a fresh stub per
+    test, this reuses the override module_fhir_stub installed for the module.
+    """
+    yield module_fhir_stub
+    module_fhir_stub.reset()
+
+
+@pytest.fixture(scope="session")
+def match_url():
+    """Path of the patient $match endpoint, resolved from the app's routes."""
+    return app.url_path_for("match_patient")
+
+
+@pytest.fixture(scope="session")
+def get_patient_url_tmpl():
+    """
+    Path template for the get-patient endpoint, resolved once from the app's routes.
+
+    Fill it with ``.format(pid=...)``; unlike ``url_path_for`` this also
+    accepts the empty patient id used by routing tests.
+    """
+    return app.url_path_for("get_patient", patient_id="{pid}")
+
+
+@pytest.fixture(scope="session")
+def vitals_url_tmpl():
+    """Path template for the vitals endpoint; fill it with ``.format(pid=...)``."""
+    return app.url_path_for("get_vitals", patient_id="{pid}")
+
+
+@pytest.fixture(scope="session")
+def latest_vitals_url_tmpl():
+    """Path template for the latest-vitals endpoint; fill it with ``.format(pid=...)``."""
+    return app.url_path_for("get_latest_vitals", patient_id="{pid}")
+
+
+@pytest.fixture(scope="session")
 def sample_patient_id():
     """Sample patient ID for testing."""
     return "test-patient-123"
@@ -129,54 +269,115 @@ def mock_requests_session():
         yield session_instance
 
 
+def _make_mock_auth_client():
+    """Build an EpicAuthClient mock that hands out fixed auth headers."""
+    auth_instance = Mock()
+    auth_instance.get_auth_headers.return_value = {
+        "Authorization": "Bearer test-token",
+        "Accept": "application/fhir+json"
+    }
+    auth_instance.fetch_token = Mock()
+    return auth_instance
+
+
 @pytest.fixture
 def mock_auth_client():
     """Mock authentication client."""
     with patch('app.services.fhir_client.EpicAuthClient') as mock_auth:
-        auth_instance = Mock()
-        auth_instance.get_auth_headers.return_value = {
-            "Authorization": "Bearer test-token",
-            "Accept": "application/fhir+json"
-        }
-        auth_instance.fetch_token = Mock()
+        auth_instance = _make_mock_auth_client()
         mock_auth.return_value = auth_instance
         yield auth_instance
 
 
-class MockResponse:
-    """Mock HTTP response for testing."""
-    
-    def __init__(self, status_code: int, json_data: Optional[Dict[str, Any]] = None, 
-                 text: str = "", ok: bool = None):
-        self.status_code = status_code
-        self._json_data = json_data or {}
-        self.text = text
-        self.ok = ok if ok is not None else (200 <= status_code < 300)
-    
-    def json(self):
-        if self._json_data:
-            return self._json_data
-        raise ValueError("No JSON data")
+@pytest.fixture
+def disable_fhir_request_retries():
+    """
+    Make FHIRClient._make_request fail on the first error instead of retrying.
+
+    Opt in from tests that assert on a single failed request; the tenacity
+    policy would otherwise retry FHIR and network errors before the original
+    FHIRException surfaces. Tests that do not request it run the real policy.
+    """
+    retrying = FHIRClient._make_request.retry
+    original_retry = retrying.retry
+    retrying.retry = retry_never
+    yield
+    retrying.retry = original_retry
+
+
+async def _no_sleep(seconds: float) -> None:
+    """Stand-in for tenacity's async sleep that returns immediately."""
 
 
 @pytest.fixture
+def skip_fhir_retry_backoff():
+    """
+    Replace the backoff sleep of FHIRClient._make_request's retry policy with a no-op.
+
+    Opt in from tests that run the real retry policy, so each retry happens
+    straight away instead of waiting out wait_exponential.
+    """
+    retrying = FHIRClient._make_request.retry
+    original_sleep = retrying.sleep
+    retrying.sleep = _no_sleep
+    yield
+    retrying.sleep = original_sleep
+
+
+@pytest.fixture(scope="session")
 def create_mock_response():
     """Factory for creating mock HTTP responses."""
     return MockResponse
 
 
-@pytest.fixture
-def fhir_client_with_mocks(mock_requests_session, mock_auth_client):
-    """Create a real FHIR client with mocked dependencies."""
-    with patch('app.core.config.settings') as mock_settings:
+@pytest.fixture(scope="session")
+def session_fhir_client_with_mocks():
+    """
+    Real FHIR client with a mocked HTTP session and auth client, built once per session.
+
+    The session mock is autospecced from requests.Session, so it only exposes
+    the real API surface and rejects calls that do not fit its signatures.
+
+    Tests use it through ``fhir_client_with_mocks``, which resets the mocks
+    after each test.
+    """
+    session = create_autospec(requests.Session, instance=True)
+    with patch('app.services.fhir_client.requests.Session', return_value=session), \
+            patch('app.services.fhir_client.EpicAuthClient', return_value=_make_mock_auth_client()), \
+            patch('app.core.config.settings') as mock_settings:
         mock_settings.fhir_api_base = "https://test-fhir.example.com/api/FHIR/R4"
         mock_settings.fhir_timeout = 30
         
-        client = FHIRClient()
-        client.session = mock_requests_session
-        client.auth_client = mock_auth_client
-        
-        return client
+        return FHIRClient()
+
+
+@pytest.fixture
+def fhir_client_with_mocks(session_fhir_client_with_mocks):
+    """
+    Create a real FHIR client with mocked dependencies.
+
+    The client is shared across the session (one per xdist worker), so every
+    mock a test may configure or call is reset on teardown; get_auth_headers
+    keeps its canned return value.
+    """
+    client = session_fhir_client_with_mocks
+    yield client
+    client.session.reset_mock(return_value=True, side_effect=True)
+    client.auth_client.reset_mock()
+    client.auth_client.fetch_token.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def fhir_backend(fhir_client_with_mocks, monkeypatch):
+    """
+    Serve the shared FHIR client's HTTP calls from an in-memory MockFHIRBackend.
+
+    Register routes with ``fhir_backend.register(...)``; the client's Mock
+    session is restored after the test.
+    """
+    backend = MockFHIRBackend(fhir_client_with_mocks.base_url)
+    monkeypatch.setattr(fhir_client_with_mocks, "session", backend)
+    return backend
 
 
 @pytest.fixture
@@ -187,6 +388,7 @@ def sample_datetime():
 
 @pytest.fixture(autouse=True)
 def reset_dependency_overrides():
-    """Automatically reset dependency overrides after each test."""
+    """Automatically reset dependency overrides after each test, keeping module-wide ones."""
     yield
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+    app.dependency_overrides.update(_MODULE_OVERRIDES)
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Test-only FastAPI app factories for endpoint tests.
+"""
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+
+
+def _mirror_app(source_app: FastAPI, *, keep_response_model: bool) -> FastAPI:
+    """
+    Re-register the source app's API routes on a FastAPI app that serializes with ORJSONResponse.
+
+    Middleware, exception handlers and dependency overrides are shared with
+    the source app, so auth, error mapping and FHIR client mocking behave the
+    same.
+    """
+    mirror_app = FastAPI(default_response_class=ORJSONResponse)
+    mirror_app.user_middleware = list(source_app.user_middleware)
+    mirror_app.exception_handlers = dict(source_app.exception_handlers)
+    mirror_app.dependency_overrides = source_app.dependency_overrides
+
+    for route in source_app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        mirror_app.add_api_route(
+            route.path,
+            route.endpoint,
+            methods=list(route.methods),
+            name=route.name,
+            status_code=route.status_code,
+            dependencies=route.dependencies,
+            response_model=route.response_model if keep_response_model else None,
+        )
+
+    return mirror_app
+
+
+def create_routing_app(source_app: FastAPI) -> FastAPI:
+    """
+    Mirror the production app's API routes without response_model validation.
+
+    Handlers' return values are encoded straight to JSON with ORJSONResponse
+    instead of being re-validated against the route's response_model. Use it
+    for tests that check routing, query parsing and payload forwarding; keep
+    contract tests on the real app.
+    """
+    return _mirror_app(source_app, keep_response_model=False)
+
+
+def create_orjson_app(source_app: FastAPI) -> FastAPI:
+    """
+    Mirror the production app's API routes, serializing responses with ORJSONResponse.
+
+    Responses are still validated against each route's response_model, so
+    contract tests keep their coverage; only the final JSON encoding step
+    moves from the stdlib json module to orjson.
+    """
+    return _mirror_app(source_app, keep_response_model=True)
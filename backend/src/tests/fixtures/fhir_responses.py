@@ -2,8 +2,16 @@
 FHIR response fixtures for testing.
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
+import pytest
+from typing import Callable, Dict, Any, List, Optional
+from datetime import date, datetime
+
+from app.models.patient import PatientMatchResponse, PatientMatchResult, PatientResponse
+from app.models.vitals import (
+    VitalSign, VitalSignsData, VitalSignsLatestResponse, VitalSignsResponse, VitalSignsTimeSeries
+)
+
+BIRTH_DATE_1980 = date(1980, 1, 1)
 
 
 def patient_response(patient_id: str = "test-patient-123") -> Dict[str, Any]:
@@ -308,4 +316,124 @@ def get_loinc_display(loinc_code: str) -> str:
         "5902-2": "Prothrombin time (PT)",
         "3173-2": "Partial thromboplastin time (PTT)",
     }
-    return loinc_displays.get(loinc_code, f"LOINC {loinc_code}")
\ No newline at end of file
+    return loinc_displays.get(loinc_code, f"LOINC {loinc_code}")
+
+
+@pytest.fixture(scope="session")
+def sample_patient_response(sample_patient_id) -> PatientResponse:
+    """Validated PatientResponse for John Doe, built once per session."""
+    return PatientResponse(
+        id=sample_patient_id,
+        active=True,
+        gender="male",
+        birth_date=BIRTH_DATE_1980,
+        primary_address="123 Main St",
+        city="Anytown",
+        state="CA",
+        postal_code="12345",
+        height_cm=175.0,
+        weight_kg=70.0,
+        primary_name="John Doe",
+        primary_phone="+1-555-123-4567"
+    )
+
+
+@pytest.fixture(scope="session")
+def single_match_bundle(sample_patient_response) -> PatientMatchResponse:
+    """Patient $match bundle with one exact-score match."""
+    return PatientMatchResponse(
+        resourceType="Bundle",
+        total=1,
+        entry=[PatientMatchResult(resource=sample_patient_response, search={"score": 1.0})]
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_match_bundle() -> PatientMatchResponse:
+    """Patient $match bundle with no matches."""
+    return PatientMatchResponse(resourceType="Bundle", total=0, entry=[])
+
+
+@pytest.fixture(scope="session")
+def three_match_bundle() -> PatientMatchResponse:
+    """Patient $match bundle with three matches in descending score order."""
+    return PatientMatchResponse(
+        resourceType="Bundle",
+        total=3,
+        entry=[
+            PatientMatchResult(
+                resource=PatientResponse(id="patient-1", primary_name="John Smith"),
+                search={"score": 1.0}
+            ),
+            PatientMatchResult(
+                resource=PatientResponse(id="patient-2", primary_name="John Smith"),
+                search={"score": 0.9}
+            ),
+            PatientMatchResult(
+                resource=PatientResponse(id="patient-3", primary_name="John Smith"),
+                search={"score": 0.8}
+            )
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def vital_sign_factory() -> Callable[..., VitalSign]:
+    """
+    Factory for VitalSign payloads handed to a mocked FHIR client.
+
+    Built with ``model_construct``: the endpoint re-validates the response
+    against its response_model, so validating test inputs as well is redundant.
+    """
+    def make(value: float = 72.0, unit: str = "beats/min", loinc_code: str = "8867-4",
+             timestamp: Optional[datetime] = None, display_name: Optional[str] = None) -> VitalSign:
+        return VitalSign.model_construct(
+            value=value,
+            unit=unit,
+            timestamp=timestamp,
+            loinc_code=loinc_code,
+            display_name=display_name
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def vitals_response_factory() -> Callable[..., VitalSignsResponse]:
+    """
+    Factory for VitalSignsResponse payloads; keyword overrides other than the
+    response fields become VitalSignsTimeSeries series (e.g. ``heart_rate=[...]``).
+    """
+    # Shared by every response without series; the endpoints never mutate it.
+    empty_ts = VitalSignsTimeSeries.model_construct()
+
+    def make(patient_id: str, total_entries: int = 0,
+             date_range: Optional[Dict[str, datetime]] = None, **series) -> VitalSignsResponse:
+        return VitalSignsResponse.model_construct(
+            patient_id=patient_id,
+            vital_signs=VitalSignsTimeSeries.model_construct(**series) if series else empty_ts,
+            total_entries=total_entries,
+            date_range=date_range
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def latest_vitals_factory() -> Callable[..., VitalSignsLatestResponse]:
+    """
+    Factory for VitalSignsLatestResponse payloads; keyword overrides other than
+    the response fields become VitalSignsData readings (e.g. ``heart_rate=...``).
+    """
+    # Shared by every response without readings; the endpoints never mutate it.
+    empty_readings = VitalSignsData.model_construct()
+
+    def make(patient_id: str, last_updated: Optional[datetime] = None,
+             **readings) -> VitalSignsLatestResponse:
+        return VitalSignsLatestResponse.model_construct(
+            patient_id=patient_id,
+            vital_signs=VitalSignsData.model_construct(**readings) if readings else empty_readings,
+            last_updated=last_updated
+        )
+
+    return make
@@ -0,0 +1,29 @@
+"""
+Helpers for asserting on decoded JSON response bodies.
+"""
+
+from typing import Any
+
+import orjson
+
+
+def as_json(response) -> Any:
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
+
+
+def dig(data: Any, path: str) -> Any:
+    """Resolve a dotted path (dict keys / list indices) in a JSON body; a trailing "#" yields len()."""
+    for key in path.split("."):
+        if key == "#":
+            return len(data)
+        data = data[int(key)] if isinstance(data, list) else data[key]
+    return data
+
+
+def assert_fhir_error(response, status_code: int, fragment: str) -> None:
+    """Assert a response is a sanitized FHIR_ERROR with the given status and message fragment."""
+    assert response.status_code == status_code
+    data = as_json(response)
+    assert data["error"] == "FHIR_ERROR"
+    assert fragment in data["message"]
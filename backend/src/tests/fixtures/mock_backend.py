@@ -0,0 +1,60 @@
+"""
+In-memory FHIR transport for FHIRClient unit tests.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from tests.fixtures.fhir_responses import operation_outcome_error
+
+
+class MockResponse:
+    """Mock HTTP response for testing."""
+
+    def __init__(self, status_code: int, json_data: Optional[Dict[str, Any]] = None,
+                 text: str = "", ok: bool = None):
+        self.status_code = status_code
+        self._json_data = json_data or {}
+        self.text = text
+        self.ok = ok if ok is not None else (200 <= status_code < 300)
+
+    def json(self):
+        if self._json_data:
+            return self._json_data
+        raise ValueError("No JSON data")
+
+
+def _freeze(params: Optional[Dict[str, Any]]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    return tuple(sorted(params.items())) if params else None
+
+
+class MockFHIRBackend:
+    """
+    Deterministic stand-in for the ``requests.Session`` used by FHIRClient.
+
+    Responses are registered per ``(method, endpoint, params)`` and looked up
+    when FHIRClient calls ``session.request``; a route registered without
+    params matches any query string. Every request is recorded in ``calls``
+    as ``(method, endpoint, kwargs)``. Unregistered routes get a 404
+    OperationOutcome, so a wrong URL fails the test instead of returning a
+    Mock.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self.routes: Dict[tuple, MockResponse] = {}
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    def register(self, method: str, endpoint: str, body: Optional[Dict[str, Any]], status: int = 200,
+                 params: Optional[Dict[str, Any]] = None) -> None:
+        """Serve ``body`` with ``status`` for ``method`` requests to ``endpoint``."""
+        key = (method.upper(), endpoint.lstrip("/"), _freeze(params))
+        self.routes[key] = MockResponse(status, body)
+
+    def request(self, method: str, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        endpoint = url[len(self.base_url):].lstrip("/") if url.startswith(self.base_url) else url
+        self.calls.append((method, endpoint, {"params": params, **kwargs}))
+        method = method.upper()
+        response = self.routes.get((method, endpoint, _freeze(params))) or self.routes.get((method, endpoint, None))
+        if response is None:
+            return MockResponse(404, operation_outcome_error("error", "not-found", f"No route for {method} {endpoint}"))
+        return response
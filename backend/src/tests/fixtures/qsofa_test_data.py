@@ -5,7 +5,9 @@ Contains patient scenarios for testing qSOFA scoring algorithms with
 medium, high, and critical risk patients.
 """
 
+import pytest
 from datetime import datetime
+from typing import Dict
 from app.models.qsofa import QsofaParameter, QsofaParameters
 
 
@@ -141,6 +143,22 @@ def create_low_risk_patient_data() -> QsofaParameters:
     )
 
 
+@pytest.fixture(scope="session")
+def qsofa_patients() -> Dict[str, QsofaParameters]:
+    """
+    The four qSOFA patient scenarios, built once per session.
+
+    Keyed like EXPECTED_QSOFA_SCORES ("low_risk" ... "critical_risk"). The
+    instances are shared, so tests must not mutate them.
+    """
+    return {
+        "low_risk": create_low_risk_patient_data(),
+        "medium_risk": create_medium_risk_patient_data(),
+        "high_risk": create_high_risk_patient_data(),
+        "critical_risk": create_critical_risk_patient_data(),
+    }
+
+
 # Expected scores for validation
 EXPECTED_QSOFA_SCORES = {
     "low_risk": {
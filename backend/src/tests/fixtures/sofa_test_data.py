@@ -6,7 +6,9 @@ medium, high, and critical risk patients.
 """
 
 from datetime import datetime
-from app.models.sofa import SofaParameter, VasopressorDoses, SofaParameters
+from functools import lru_cache
+from app.models.sofa import SofaParameter, VasopressorDoses, SofaParameters, SofaScoreResult
+from app.utils.sofa_scoring import calculate_sofa_from_parameters
 
 
 def create_medium_risk_patient_data() -> SofaParameters:
@@ -230,6 +232,25 @@ def create_critical_risk_patient_data() -> SofaParameters:
     )
 
 
+PATIENT_FACTORIES = {
+    "medium_risk": create_medium_risk_patient_data,
+    "high_risk": create_high_risk_patient_data,
+    "critical_risk": create_critical_risk_patient_data,
+}
+
+
+@lru_cache(maxsize=None)
+def precomputed_sofa_result(risk_level: str) -> SofaScoreResult:
+    """
+    SOFA result for a patient scenario, computed once and cached
+    
+    Runs the synchronous scoring step on freshly built patient data, so it
+    needs no FHIR client or event loop. Treat the returned result as read-only.
+    """
+    patient_data = PATIENT_FACTORIES[risk_level]()
+    return calculate_sofa_from_parameters(patient_data, patient_data.patient_id, patient_data.timestamp)
+
+
 # Expected scores for validation
 EXPECTED_SCORES = {
     "medium_risk": {
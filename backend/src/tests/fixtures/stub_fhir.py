@@ -0,0 +1,72 @@
+"""
+Lightweight stand-in for FHIRClient in endpoint tests.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class StubFHIRClient:
+    """
+    Minimal async FHIR client stub for dependency overrides.
+
+    Each router-facing coroutine records ``(method_name, args)`` in ``calls``
+    and then, in order of precedence, raises ``errors[name]``, returns
+    ``handlers[name](*args)`` or returns ``returns[name]``. Use it when a test
+    only needs "return this" or "raise this"; keep the Mock-based
+    ``mock_fhir_client`` for tests that need Mock's assertion helpers.
+    """
+
+    def __init__(self):
+        self.calls: List[Tuple[str, tuple]] = []
+        self.returns: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.handlers: Dict[str, Callable[..., Any]] = {}
+
+    async def _dispatch(self, name: str, args: tuple) -> Any:
+        self.calls.append((name, args))
+        if name in self.errors:
+            raise self.errors[name]
+        if name in self.handlers:
+            return self.handlers[name](*args)
+        return self.returns[name]
+
+    def reset(self) -> None:
+        """Forget recorded calls and configured returns, errors and handlers."""
+        self.calls.clear()
+        self.returns.clear()
+        self.errors.clear()
+        self.handlers.clear()
+
+    def calls_to(self, name: str) -> List[tuple]:
+        """Return the positional args of every recorded call to ``name``."""
+        return [args for called, args in self.calls if called == name]
+
+    async def get_patient(self, *args):
+        return await self._dispatch("get_patient", args)
+
+    async def match_patient(self, *args):
+        return await self._dispatch("match_patient", args)
+
+    async def get_vitals(self, *args):
+        return await self._dispatch("get_vitals", args)
+
+    async def get_latest_vitals(self, *args):
+        return await self._dispatch("get_latest_vitals", args)
+
+    async def get_labs(self, *args):
+        return await self._dispatch("get_labs", args)
+
+    async def get_critical_labs(self, *args):
+        return await self._dispatch("get_critical_labs", args)
+
+    async def get_encounter(self, *args):
+        return await self._dispatch("get_encounter", args)
+
+    async def get_conditions(self, *args):
+        return await self._dispatch("get_conditions", args)
+
+    async def get_medications(self, *args):
+        return await self._dispatch("get_medications", args)
+
+    async def get_fluid_balance(self, *args):
+        return await self._dispatch("get_fluid_balance", args)
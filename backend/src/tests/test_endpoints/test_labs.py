@@ -2,171 +2,277 @@
 Integration tests for labs endpoints.
 """
 
+import asyncio
+
 import pytest
 from fastapi import status
 from datetime import datetime
-from unittest.mock import AsyncMock
+from unittest.mock import ANY
 
-from app.models.labs import LabResultsResponse, CriticalLabsResponse, LabResultsData, LabValue, CBCResults, MetabolicPanel
+from app.models.labs import CriticalLabsResponse, LabValue
 from app.core.exceptions import FHIRException
+from tests.fixtures.json_paths import as_json, dig
 
+pytestmark = pytest.mark.asyncio
 
-class TestLabsEndpoints:
-    """Test labs-related API endpoints."""
+SAMPLE_PATIENT_ID = "test-patient-123"
+LABS_URL = f"/api/v1/sepsis-alert/patients/{SAMPLE_PATIENT_ID}/labs"
+CRITICAL_URL = LABS_URL + "/critical"
+TS = datetime(2023, 1, 1, 12, 0, 0)
 
-    def test_get_labs_success(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test successful labs retrieval."""
-        # Arrange
-        expected_labs_data = LabResultsResponse(
-            patient_id=sample_patient_id,
-            lab_results=LabResultsData(
-                cbc=CBCResults(
-                    white_blood_cell_count=LabValue(
-                        value=8.5,
-                        unit="10*3/uL",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="6690-2",
-                        display_name="Leukocytes [#/volume] in Blood"
-                    ),
-                    platelet_count=LabValue(
-                        value=250.0,
-                        unit="10*3/uL",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="777-3",
-                        display_name="Platelets [#/volume] in Blood"
-                    )
-                ),
-                metabolic_panel=MetabolicPanel(
-                    creatinine=LabValue(
-                        value=1.0,
-                        unit="mg/dL",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="2160-0",
-                        display_name="Creatinine [Mass/volume] in Serum"
-                    )
-                )
-            ),
-            total_entries=3,
-            date_range=None
-        )
-        
-        mock_fhir_client_dependency.get_labs.return_value = expected_labs_data
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs")
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert data["total_entries"] == 3
-        assert "lab_results" in data
-        assert data["lab_results"]["cbc"]["white_blood_cell_count"]["value"] == 8.5
-        assert data["lab_results"]["cbc"]["platelet_count"]["value"] == 250.0
-        
-        mock_fhir_client_dependency.get_labs.assert_called_once_with(
-            sample_patient_id, None, None, None
-        )
+# Labs payloads are plain dicts: the route's LabResultsResponse response_model
+# validates them once on the way out, instead of once here and again there.
 
-    def test_get_labs_with_date_range(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test labs retrieval with date range parameters."""
-        # Arrange
-        start_date = "2023-01-01T00:00:00"
-        end_date = "2023-01-02T23:59:59"
-        
-        expected_labs_data = LabResultsResponse(
-            patient_id=sample_patient_id,
-            lab_results=LabResultsData(),
-            total_entries=0,
-            date_range={"start": datetime(2023, 1, 1), "end": datetime(2023, 1, 2, 23, 59, 59)}
-        )
-        
-        mock_fhir_client_dependency.get_labs.return_value = expected_labs_data
-        
-        # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs",
-            params={"start_date": start_date, "end_date": end_date}
-        )
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert data["date_range"] is not None
-        
-        # Verify the FHIR client was called with parsed datetime objects
-        call_args = mock_fhir_client_dependency.get_labs.call_args[0]
-        assert isinstance(call_args[1], datetime)  # start_date
-        assert isinstance(call_args[2], datetime)  # end_date
 
-    def test_get_labs_with_category_filter(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test labs retrieval with specific category filter."""
-        # Arrange
-        lab_category = "CBC"
-        
-        expected_labs_data = LabResultsResponse(
-            patient_id=sample_patient_id,
-            lab_results=LabResultsData(
-                cbc=CBCResults(
-                    white_blood_cell_count=LabValue(
-                        value=9.2,
-                        unit="10*3/uL",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="6690-2"
-                    )
-                )
+@pytest.fixture(scope="module")
+def labs_payload():
+    """CBC and metabolic results for the default labs query."""
+    return {
+        "patient_id": SAMPLE_PATIENT_ID,
+        "lab_results": {
+            "cbc": {
+                "white_blood_cell_count": {
+                    "value": 8.5,
+                    "unit": "10*3/uL",
+                    "timestamp": TS,
+                    "loinc_code": "6690-2",
+                    "display_name": "Leukocytes [#/volume] in Blood"
+                },
+                "platelet_count": {
+                    "value": 250.0,
+                    "unit": "10*3/uL",
+                    "timestamp": TS,
+                    "loinc_code": "777-3",
+                    "display_name": "Platelets [#/volume] in Blood"
+                }
+            },
+            "metabolic_panel": {
+                "creatinine": {
+                    "value": 1.0,
+                    "unit": "mg/dL",
+                    "timestamp": TS,
+                    "loinc_code": "2160-0",
+                    "display_name": "Creatinine [Mass/volume] in Serum"
+                }
+            }
+        },
+        "total_entries": 3,
+        "date_range": None
+    }
+
+
+@pytest.fixture(scope="module")
+def date_range_labs_payload():
+    """Empty results echoing a one-day date range."""
+    return {
+        "patient_id": SAMPLE_PATIENT_ID,
+        "lab_results": {},
+        "total_entries": 0,
+        "date_range": {"start": datetime(2023, 1, 1), "end": datetime(2023, 1, 2, 23, 59, 59)}
+    }
+
+
+@pytest.fixture(scope="module")
+def cbc_labs_payload():
+    """Single CBC result for the category filter."""
+    return {
+        "patient_id": SAMPLE_PATIENT_ID,
+        "lab_results": {
+            "cbc": {
+                "white_blood_cell_count": {
+                    "value": 9.2,
+                    "unit": "10*3/uL",
+                    "timestamp": TS,
+                    "loinc_code": "6690-2"
+                }
+            }
+        },
+        "total_entries": 1,
+        "date_range": None
+    }
+
+
+@pytest.fixture(scope="module")
+def all_categories_labs_payload():
+    """CBC and metabolic panel results across categories."""
+    return {
+        "patient_id": SAMPLE_PATIENT_ID,
+        "lab_results": {
+            "cbc": {
+                "white_blood_cell_count": {"value": 8.5, "unit": "10*3/uL", "timestamp": TS, "loinc_code": "6690-2"},
+                "platelet_count": {"value": 250.0, "unit": "10*3/uL", "timestamp": TS, "loinc_code": "777-3"}
+            },
+            "metabolic_panel": {
+                "creatinine": {"value": 1.0, "unit": "mg/dL", "timestamp": TS, "loinc_code": "2160-0"},
+                "glucose": {"value": 95.0, "unit": "mg/dL", "timestamp": TS, "loinc_code": "2345-7"}
+            }
+        },
+        "total_entries": 4,
+        "date_range": None
+    }
+
+
+@pytest.fixture(scope="module")
+def empty_labs_payload():
+    """No results, as returned for an unknown category."""
+    return {
+        "patient_id": SAMPLE_PATIENT_ID,
+        "lab_results": {},  # Empty since invalid category
+        "total_entries": 0,
+        "date_range": None
+    }
+
+
+@pytest.fixture(scope="module")
+def critical_labs_payload():
+    """One critical and one abnormal lab value."""
+    return CriticalLabsResponse(
+        patient_id=SAMPLE_PATIENT_ID,
+        critical_values=[
+            LabValue(
+                value=15.2,
+                unit="10*3/uL",
+                timestamp=TS,
+                loinc_code="6690-2",
+                display_name="Leukocytes [#/volume] in Blood",
+                interpretation=["HH"]  # Critical High
+            )
+        ],
+        abnormal_values=[
+            LabValue(
+                value=180.0,
+                unit="mg/dL",
+                timestamp=TS,
+                loinc_code="2345-7",
+                display_name="Glucose [Mass/volume] in Serum",
+                interpretation=["H"]  # High
+            )
+        ],
+        last_updated=TS
+    )
+
+
+@pytest.fixture(scope="module")
+def no_critical_labs_payload():
+    """No critical or abnormal lab values."""
+    return CriticalLabsResponse(
+        patient_id=SAMPLE_PATIENT_ID,
+        critical_values=[],
+        abnormal_values=[],
+        last_updated=TS
+    )
+
+
+@pytest.fixture(scope="module")
+def multiple_critical_labs_payload():
+    """Two critical values and one abnormal value."""
+    return CriticalLabsResponse(
+        patient_id=SAMPLE_PATIENT_ID,
+        critical_values=[
+            LabValue(
+                value=2.5,
+                unit="mg/dL",
+                timestamp=TS,
+                loinc_code="2160-0",
+                display_name="Creatinine",
+                interpretation=["HH"]  # Critical High
             ),
-            total_entries=1,
-            date_range=None
-        )
-        
-        mock_fhir_client_dependency.get_labs.return_value = expected_labs_data
-        
-        # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs",
-            params={"lab_category": lab_category}
-        )
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert data["total_entries"] == 1
-        assert data["lab_results"]["cbc"]["white_blood_cell_count"]["value"] == 9.2
-        
-        mock_fhir_client_dependency.get_labs.assert_called_once_with(
-            sample_patient_id, None, None, lab_category
-        )
+            LabValue(
+                value=50.0,
+                unit="10*3/uL",
+                timestamp=TS,
+                loinc_code="777-3",
+                display_name="Platelets",
+                interpretation=["LL"]  # Critical Low
+            )
+        ],
+        abnormal_values=[
+            LabValue(
+                value=12.5,
+                unit="10*3/uL",
+                timestamp=TS,
+                loinc_code="6690-2",
+                display_name="WBC",
+                interpretation=["H"]  # High
+            )
+        ],
+        last_updated=TS
+    )
+
+
+_DATE_RANGE = {"start_date": "2023-01-01T00:00:00", "end_date": "2023-01-02T23:59:59"}
+
+
+@pytest.mark.parametrize("params,payload_fixture,expected_call,expected_fields", [
+    pytest.param(
+        {}, "labs_payload", (SAMPLE_PATIENT_ID, None, None, None),
+        {"total_entries": 3, "lab_results.cbc.white_blood_cell_count.value": 8.5,
+         "lab_results.cbc.platelet_count.value": 250.0},
+        id="no-params",
+    ),
+    pytest.param(
+        _DATE_RANGE, "date_range_labs_payload", (SAMPLE_PATIENT_ID, ANY, ANY, None),
+        {"date_range.start": "2023-01-01T00:00:00", "date_range.end": "2023-01-02T23:59:59"},
+        id="date-range",
+    ),
+    pytest.param(
+        {"lab_category": "CBC"}, "cbc_labs_payload", (SAMPLE_PATIENT_ID, None, None, "CBC"),
+        {"total_entries": 1, "lab_results.cbc.white_blood_cell_count.value": 9.2},
+        id="category-filter",
+    ),
+    pytest.param(
+        # The FHIR client should still be called (it handles invalid categories)
+        {"lab_category": "INVALID_CATEGORY"}, "empty_labs_payload",
+        (SAMPLE_PATIENT_ID, None, None, "INVALID_CATEGORY"),
+        {"total_entries": 0},
+        id="invalid-category",
+    ),
+    pytest.param(
+        {**_DATE_RANGE, "lab_category": "METABOLIC"}, "date_range_labs_payload",
+        (SAMPLE_PATIENT_ID, ANY, ANY, "METABOLIC"),
+        {},
+        id="all-parameters",
+    ),
+])
+async def test_get_labs_param_matrix(request, orjson_client, stub_fhir_client_dependency, params, payload_fixture,
+                                     expected_call, expected_fields):
+    """Test labs query parameters are parsed and forwarded to the FHIR client."""
+    # Arrange
+    stub_fhir_client_dependency.returns["get_labs"] = request.getfixturevalue(payload_fixture)
+
+    # Act
+    response = await orjson_client.get(LABS_URL, params=params)
+
+    # Assert
+    assert response.status_code == status.HTTP_200_OK
+    data = as_json(response)
+    assert data["patient_id"] == SAMPLE_PATIENT_ID
+    for path, value in expected_fields.items():
+        assert dig(data, path) == value
+
+    # Dates are forwarded as parsed datetime objects
+    assert stub_fhir_client_dependency.calls_to("get_labs") == [expected_call]
+    call_args = stub_fhir_client_dependency.calls_to("get_labs")[-1]
+    for expected, actual in zip(expected_call, call_args):
+        if expected is ANY:
+            assert isinstance(actual, datetime)
 
-    def test_get_labs_all_categories(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+
+class TestLabsEndpoints:
+    """Test labs-related API endpoints."""
+
+    async def test_get_labs_all_categories(self, orjson_client, stub_fhir_client_dependency,
+                                           all_categories_labs_payload):
         """Test labs retrieval for all lab categories."""
         # Arrange
-        expected_labs_data = LabResultsResponse(
-            patient_id=sample_patient_id,
-            lab_results=LabResultsData(
-                cbc=CBCResults(
-                    white_blood_cell_count=LabValue(value=8.5, unit="10*3/uL", timestamp=datetime.now(), loinc_code="6690-2"),
-                    platelet_count=LabValue(value=250.0, unit="10*3/uL", timestamp=datetime.now(), loinc_code="777-3")
-                ),
-                metabolic_panel=MetabolicPanel(
-                    creatinine=LabValue(value=1.0, unit="mg/dL", timestamp=datetime.now(), loinc_code="2160-0"),
-                    glucose=LabValue(value=95.0, unit="mg/dL", timestamp=datetime.now(), loinc_code="2345-7")
-                )
-            ),
-            total_entries=4,
-            date_range=None
-        )
-        
-        mock_fhir_client_dependency.get_labs.return_value = expected_labs_data
+        stub_fhir_client_dependency.returns["get_labs"] = all_categories_labs_payload
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs")
+        response = await orjson_client.get(LABS_URL)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         assert data["total_entries"] == 4
         
         # Verify multiple categories are present
@@ -176,301 +282,116 @@ class TestLabsEndpoints:
         assert lab_results["metabolic_panel"]["creatinine"]["value"] == 1.0
         assert lab_results["metabolic_panel"]["glucose"]["value"] == 95.0
 
-    def test_get_labs_patient_not_found(self, test_client, mock_fhir_client_dependency):
-        """Test labs retrieval for non-existent patient."""
-        # Arrange
-        patient_id = "nonexistent-patient"
-        mock_fhir_client_dependency.get_labs.side_effect = FHIRException(404, "Patient not found")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}/labs")
-        
-        # Assert
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Patient not found" in data["message"]
-
-    def test_get_labs_access_denied(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test labs retrieval with access denied."""
-        # Arrange
-        mock_fhir_client_dependency.get_labs.side_effect = FHIRException(403, "Access denied to patient labs")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs")
-        
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Access denied" in data["message"]
-
-    def test_get_labs_server_error(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test labs retrieval with server error."""
-        # Arrange
-        mock_fhir_client_dependency.get_labs.side_effect = FHIRException(500, "FHIR server unavailable")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs")
-        
-        # Assert
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "FHIR server unavailable" in data["message"]
-
-    def test_get_labs_invalid_date_format(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_labs_invalid_date_format(self, validation_client):
         """Test labs retrieval with invalid date format."""
         # Arrange
         invalid_start_date = "invalid-date"
         
         # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs",
+        response = await validation_client.get(
+            LABS_URL,
             params={"start_date": invalid_start_date}
         )
         
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        data = response.json()
+        data = as_json(response)
         assert "detail" in data
 
-    def test_get_labs_invalid_category(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test labs retrieval with invalid category."""
-        # Arrange
-        invalid_category = "INVALID_CATEGORY"
-        
-        expected_labs_data = LabResultsResponse(
-            patient_id=sample_patient_id,
-            lab_results=LabResultsData(),  # Empty since invalid category
-            total_entries=0,
-            date_range=None
-        )
-        
-        mock_fhir_client_dependency.get_labs.return_value = expected_labs_data
-        
-        # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs",
-            params={"lab_category": invalid_category}
-        )
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["total_entries"] == 0
-        
-        # The FHIR client should still be called (it handles invalid categories)
-        mock_fhir_client_dependency.get_labs.assert_called_once_with(
-            sample_patient_id, None, None, invalid_category
-        )
 
-    def test_get_labs_with_all_parameters(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test labs retrieval with all query parameters."""
-        # Arrange
-        start_date = "2023-01-01T00:00:00"
-        end_date = "2023-01-02T23:59:59"
-        lab_category = "METABOLIC"
-        
-        expected_labs_data = LabResultsResponse(
-            patient_id=sample_patient_id,
-            lab_results=LabResultsData(),
-            total_entries=0,
-            date_range={"start": datetime(2023, 1, 1), "end": datetime(2023, 1, 2, 23, 59, 59)}
-        )
-        
-        mock_fhir_client_dependency.get_labs.return_value = expected_labs_data
-        
-        # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs",
-            params={
-                "start_date": start_date,
-                "end_date": end_date,
-                "lab_category": lab_category
-            }
-        )
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        
-        # Verify all parameters were passed correctly
-        call_args = mock_fhir_client_dependency.get_labs.call_args[0]
-        assert call_args[0] == sample_patient_id
-        assert isinstance(call_args[1], datetime)  # start_date
-        assert isinstance(call_args[2], datetime)  # end_date
-        assert call_args[3] == lab_category
+def _check_single_critical(response):
+    """One critical WBC and one abnormal glucose value."""
+    assert response.status_code == status.HTTP_200_OK
+    data = as_json(response)
+    assert data["patient_id"] == SAMPLE_PATIENT_ID
+    assert len(data["critical_values"]) == 1
+    assert len(data["abnormal_values"]) == 1
 
+    # Verify critical value details
+    critical_value = data["critical_values"][0]
+    assert critical_value["value"] == 15.2
+    assert critical_value["loinc_code"] == "6690-2"
+    assert critical_value["interpretation"] == ["HH"]
 
-class TestCriticalLabsEndpoint:
-    """Test critical labs endpoint."""
+    # Verify abnormal value details
+    abnormal_value = data["abnormal_values"][0]
+    assert abnormal_value["value"] == 180.0
+    assert abnormal_value["loinc_code"] == "2345-7"
 
-    def test_get_critical_labs_success(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test successful critical labs retrieval."""
-        # Arrange
-        expected_critical_labs = CriticalLabsResponse(
-            patient_id=sample_patient_id,
-            critical_values=[
-                LabValue(
-                    value=15.2,
-                    unit="10*3/uL",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="6690-2",
-                    display_name="Leukocytes [#/volume] in Blood",
-                    interpretation=["HH"]  # Critical High
-                )
-            ],
-            abnormal_values=[
-                LabValue(
-                    value=180.0,
-                    unit="mg/dL",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="2345-7",
-                    display_name="Glucose [Mass/volume] in Serum",
-                    interpretation=["H"]  # High
-                )
-            ],
-            last_updated=datetime(2023, 1, 1, 12, 0, 0)
-        )
-        
-        mock_fhir_client_dependency.get_critical_labs.return_value = expected_critical_labs
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs/critical")
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert len(data["critical_values"]) == 1
-        assert len(data["abnormal_values"]) == 1
-        
-        # Verify critical value details
-        critical_value = data["critical_values"][0]
-        assert critical_value["value"] == 15.2
-        assert critical_value["loinc_code"] == "6690-2"
-        assert critical_value["interpretation"] == ["HH"]
-        
-        # Verify abnormal value details
-        abnormal_value = data["abnormal_values"][0]
-        assert abnormal_value["value"] == 180.0
-        assert abnormal_value["loinc_code"] == "2345-7"
-        
-        mock_fhir_client_dependency.get_critical_labs.assert_called_once_with(sample_patient_id)
 
-    def test_get_critical_labs_no_critical_values(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test critical labs retrieval with no critical values."""
-        # Arrange
-        expected_critical_labs = CriticalLabsResponse(
-            patient_id=sample_patient_id,
-            critical_values=[],
-            abnormal_values=[],
-            last_updated=datetime(2023, 1, 1, 12, 0, 0)
-        )
-        
-        mock_fhir_client_dependency.get_critical_labs.return_value = expected_critical_labs
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs/critical")
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert len(data["critical_values"]) == 0
-        assert len(data["abnormal_values"]) == 0
+def _check_no_critical(response):
+    """No critical or abnormal values."""
+    assert response.status_code == status.HTTP_200_OK
+    data = as_json(response)
+    assert data["patient_id"] == SAMPLE_PATIENT_ID
+    assert len(data["critical_values"]) == 0
+    assert len(data["abnormal_values"]) == 0
 
-    def test_get_critical_labs_multiple_values(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test critical labs retrieval with multiple critical and abnormal values."""
-        # Arrange
-        expected_critical_labs = CriticalLabsResponse(
-            patient_id=sample_patient_id,
-            critical_values=[
-                LabValue(
-                    value=2.5,
-                    unit="mg/dL",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="2160-0",
-                    display_name="Creatinine",
-                    interpretation=["HH"]  # Critical High
-                ),
-                LabValue(
-                    value=50.0,
-                    unit="10*3/uL",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="777-3",
-                    display_name="Platelets",
-                    interpretation=["LL"]  # Critical Low
-                )
-            ],
-            abnormal_values=[
-                LabValue(
-                    value=12.5,
-                    unit="10*3/uL",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="6690-2",
-                    display_name="WBC",
-                    interpretation=["H"]  # High
-                )
-            ],
-            last_updated=datetime(2023, 1, 1, 12, 0, 0)
-        )
-        
-        mock_fhir_client_dependency.get_critical_labs.return_value = expected_critical_labs
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs/critical")
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert len(data["critical_values"]) == 2
-        assert len(data["abnormal_values"]) == 1
-        
-        # Verify critical values
-        critical_values = data["critical_values"]
-        assert critical_values[0]["interpretation"] == ["HH"]
-        assert critical_values[1]["interpretation"] == ["LL"]
 
-    def test_get_critical_labs_patient_not_found(self, test_client, mock_fhir_client_dependency):
-        """Test critical labs retrieval for non-existent patient."""
-        # Arrange
-        patient_id = "nonexistent-patient"
-        mock_fhir_client_dependency.get_critical_labs.side_effect = FHIRException(404, "Patient not found")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}/labs/critical")
-        
-        # Assert
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Patient not found" in data["message"]
+def _check_multiple_critical(response):
+    """Two critical values (high and low) and one abnormal value."""
+    assert response.status_code == status.HTTP_200_OK
+    data = as_json(response)
+    assert len(data["critical_values"]) == 2
+    assert len(data["abnormal_values"]) == 1
 
-    def test_get_critical_labs_access_denied(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test critical labs retrieval with access denied."""
-        # Arrange
-        mock_fhir_client_dependency.get_critical_labs.side_effect = FHIRException(403, "Access denied to critical labs")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs/critical")
-        
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Access denied" in data["message"]
+    # Verify critical values
+    critical_values = data["critical_values"]
+    assert critical_values[0]["interpretation"] == ["HH"]
+    assert critical_values[1]["interpretation"] == ["LL"]
 
-    def test_get_critical_labs_server_error(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test critical labs retrieval with server error."""
-        # Arrange
-        mock_fhir_client_dependency.get_critical_labs.side_effect = FHIRException(500, "FHIR server error")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/labs/critical")
-        
-        # Assert
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "FHIR server error" in data["message"]
\ No newline at end of file
+
+async def test_critical_labs_scenarios(orjson_client, stub_fhir_client_dependency, critical_labs_payload,
+                                       no_critical_labs_payload, multiple_critical_labs_payload):
+    """Test critical labs retrieval for single, empty and multiple critical value results."""
+    # Arrange: each scenario gets its own patient id, so the stub stays
+    # stateless per call and the requests can run concurrently.
+    scenarios = {
+        "critical-single": (critical_labs_payload, _check_single_critical),
+        "critical-none": (no_critical_labs_payload, _check_no_critical),
+        "critical-multiple": (multiple_critical_labs_payload, _check_multiple_critical),
+    }
+    stub_fhir_client_dependency.handlers["get_critical_labs"] = lambda patient_id: scenarios[patient_id][0]
+
+    # Act
+    responses = await asyncio.gather(*(
+        orjson_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}/labs/critical")
+        for patient_id in scenarios
+    ))
+
+    # Assert
+    for (_, check), response in zip(scenarios.values(), responses):
+        check(response)
+
+    called_with = sorted(stub_fhir_client_dependency.calls_to("get_critical_labs"))
+    assert called_with == sorted((patient_id,) for patient_id in scenarios)
+
+
+@pytest.mark.parametrize("endpoint,method,patient_id,status_code,message,fragment", [
+    pytest.param("labs", "get_labs", "nonexistent-patient", status.HTTP_404_NOT_FOUND,
+                 "Patient not found", "Patient not found", id="labs-not-found"),
+    pytest.param("labs", "get_labs", SAMPLE_PATIENT_ID, status.HTTP_403_FORBIDDEN,
+                 "Access denied to patient labs", "Access denied", id="labs-access-denied"),
+    pytest.param("labs", "get_labs", SAMPLE_PATIENT_ID, status.HTTP_500_INTERNAL_SERVER_ERROR,
+                 "FHIR server unavailable", "FHIR server unavailable", id="labs-server-error"),
+    pytest.param("labs/critical", "get_critical_labs", "nonexistent-patient", status.HTTP_404_NOT_FOUND,
+                 "Patient not found", "Patient not found", id="critical-not-found"),
+    pytest.param("labs/critical", "get_critical_labs", SAMPLE_PATIENT_ID, status.HTTP_403_FORBIDDEN,
+                 "Access denied to critical labs", "Access denied", id="critical-access-denied"),
+    pytest.param("labs/critical", "get_critical_labs", SAMPLE_PATIENT_ID, status.HTTP_500_INTERNAL_SERVER_ERROR,
+                 "FHIR server error", "FHIR server error", id="critical-server-error"),
+])
+async def test_fhir_error_paths(orjson_client, stub_fhir_client_dependency, endpoint, method, patient_id,
+                                status_code, message, fragment):
+    """Test FHIR errors from labs and critical labs map to FHIR_ERROR responses."""
+    # Arrange
+    stub_fhir_client_dependency.errors[method] = FHIRException(status_code, message)
+
+    # Act
+    response = await orjson_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}/{endpoint}")
+
+    # Assert
+    assert response.status_code == status_code
+    data = as_json(response)
+    assert data["error"] == "FHIR_ERROR"
+    assert fragment in data["message"]
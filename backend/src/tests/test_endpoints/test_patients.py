@@ -2,49 +2,169 @@
 Integration tests for patient endpoints.
 """
 
+import asyncio
+from typing import Optional, Tuple
+
+import orjson
 import pytest
 from fastapi import status
-from unittest.mock import AsyncMock
 
-from app.models.patient import PatientResponse, PatientMatchRequest, PatientMatchResponse, PatientMatchResult
+from app.main import app
 from app.core.exceptions import FHIRException
-from tests.fixtures.fhir_responses import patient_response
+from app.models.patient import Address, PatientMatchRequest
+from tests.fixtures.fhir_responses import BIRTH_DATE_1980, patient_response
+
+pytestmark = pytest.mark.asyncio
+
+_OK = status.HTTP_200_OK
+_FORBIDDEN = status.HTTP_403_FORBIDDEN
+_NOT_FOUND = status.HTTP_404_NOT_FOUND
+_UNPROCESSABLE = status.HTTP_422_UNPROCESSABLE_ENTITY
+_SERVER_ERROR = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+# Shared FHIR errors; tests only raise them, never mutate them
+_EXC_NOT_FOUND = FHIRException(404, "Patient not found")
+_EXC_FORBIDDEN = FHIRException(403, "Access denied to patient data")
+_EXC_SERVER = FHIRException(500, "FHIR server error")
+_EXC_INVALID = FHIRException(400, "Invalid patient ID")
+_EXC_SERVICE_UNAVAIL = FHIRException(500, "FHIR service unavailable")
+
+BIRTH_DATE_1980_ISO = BIRTH_DATE_1980.isoformat()
+
+# Match request bodies are serialized once and posted as raw bytes.
+PAYLOAD_MATCH_BASIC = orjson.dumps({
+    "family": "Doe",
+    "given": "John",
+    "birth_date": BIRTH_DATE_1980_ISO,
+    "phone": "+1-555-123-4567"
+})
+PAYLOAD_MATCH_NONE = orjson.dumps({
+    "family": "Nonexistent",
+    "given": "Patient",
+    "birth_date": "1900-01-01"
+})
+PAYLOAD_MATCH_MISSING_FIELDS = orjson.dumps({
+    "family": "Doe"
+    # Missing required fields: given, birth_date
+})
+PAYLOAD_MATCH_INVALID_DATE = orjson.dumps({
+    "family": "Doe",
+    "given": "John",
+    "birth_date": "invalid-date-format"
+})
+PAYLOAD_MATCH_ADDRESS = orjson.dumps({
+    "family": "Doe",
+    "given": "John",
+    "birth_date": BIRTH_DATE_1980_ISO,
+    "address": {
+        "line": ["123 Main St"],
+        "city": "Anytown",
+        "state": "CA",
+        "postalCode": "12345"
+    }
+})
+PAYLOAD_MATCH_DOE = orjson.dumps({
+    "family": "Doe",
+    "given": "John",
+    "birth_date": BIRTH_DATE_1980_ISO
+})
+PAYLOAD_MATCH_SMITH = orjson.dumps({
+    "family": "Smith",
+    "given": "John",
+    "birth_date": BIRTH_DATE_1980_ISO
+})
+
+EXPECTED_MATCH_SCORES = [1.0, 0.9, 0.8]
+
+
+async def asgi_call(method: str, path: str, body: Optional[bytes] = None) -> Tuple[int, bytes]:
+    """
+    Drive the ASGI app directly with a minimal HTTP scope.
+
+    Skips the httpx request/response objects; returns the status code and the
+    raw response body. Any ``?query`` suffix on ``path`` is sent as the scope's
+    query_string. A JSON content-type is sent whenever a body is given; the Host
+    header is always ``test``.
+    """
+    path, _, query = path.partition("?")
+    headers = [(b"host", b"test")]
+    if body is not None:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "https",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 443),
+    }
+    request_sent = False
+    response_complete = asyncio.Event()
+    status_code = None
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body or b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return status_code, b"".join(chunks)
+
+
+@pytest.fixture(scope="module")
+def expected_match_requests():
+    """The PatientMatchRequest each match payload should reach the FHIR client as, keyed by payload."""
+    return {
+        PAYLOAD_MATCH_BASIC: PatientMatchRequest(
+            family="Doe", given="John", birth_date=BIRTH_DATE_1980_ISO, phone="+1-555-123-4567"
+        ),
+        PAYLOAD_MATCH_NONE: PatientMatchRequest(family="Nonexistent", given="Patient", birth_date="1900-01-01"),
+        PAYLOAD_MATCH_ADDRESS: PatientMatchRequest(
+            family="Doe", given="John", birth_date=BIRTH_DATE_1980_ISO,
+            address=Address(line=["123 Main St"], city="Anytown", state="CA", postalCode="12345"),
+        ),
+        PAYLOAD_MATCH_SMITH: PatientMatchRequest(family="Smith", given="John", birth_date=BIRTH_DATE_1980_ISO),
+    }
 
 
 class TestPatientEndpoints:
     """Test patient-related API endpoints."""
 
-    def test_get_patient_success(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_patient_success(self, get_patient_url_tmpl, module_stub_fhir_client, sample_patient_id,
+                                       sample_patient_response):
         """Test successful patient retrieval."""
         # Arrange
-        from datetime import date
-        expected_patient_data = PatientResponse(
-            id=sample_patient_id,
-            active=True,
-            gender="male",
-            birth_date=date(1980, 1, 1),
-            primary_address="123 Main St",
-            city="Anytown",
-            state="CA",
-            postal_code="12345",
-            height_cm=175.0,
-            weight_kg=70.0,
-            primary_name="John Doe",
-            primary_phone="+1-555-123-4567"
-        )
-        
-        mock_fhir_client_dependency.get_patient.return_value = expected_patient_data
+        module_stub_fhir_client.returns["get_patient"] = sample_patient_response
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}")
+        status_code, body = await asgi_call("GET", get_patient_url_tmpl.format(pid=sample_patient_id))
         
         # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        assert status_code == _OK
+        data = orjson.loads(body)
         assert data["id"] == sample_patient_id
         assert data["active"] is True
         assert data["gender"] == "male"
-        assert data["birth_date"] == "1980-01-01"
+        assert data["birth_date"] == BIRTH_DATE_1980_ISO
         assert data["primary_address"] == "123 Main St"
         assert data["city"] == "Anytown"
         assert data["state"] == "CA"
@@ -56,334 +176,128 @@ class TestPatientEndpoints:
         assert data["age"] == 45  # Calculated from birth_date
         assert data["bmi"] == 22.86  # Calculated from height/weight
         assert data["bmi_category"] == "Normal weight"
-        mock_fhir_client_dependency.get_patient.assert_called_once_with(sample_patient_id)
-
-    def test_get_patient_not_found(self, test_client, mock_fhir_client_dependency):
-        """Test patient not found scenario."""
-        # Arrange
-        patient_id = "nonexistent-patient"
-        mock_fhir_client_dependency.get_patient.side_effect = FHIRException(404, "Patient not found")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}")
-        
-        # Assert
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Patient not found" in data["message"]
-
-    def test_get_patient_forbidden(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test patient access forbidden scenario."""
-        # Arrange
-        mock_fhir_client_dependency.get_patient.side_effect = FHIRException(403, "Access denied to patient data")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}")
-        
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Access denied" in data["message"]
-
-    def test_get_patient_server_error(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test server error during patient retrieval."""
-        # Arrange
-        mock_fhir_client_dependency.get_patient.side_effect = FHIRException(500, "FHIR server error")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}")
-        
-        # Assert
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "FHIR server error" in data["message"]
+        assert module_stub_fhir_client.calls == [("get_patient", (sample_patient_id,))]
 
-    def test_get_patient_invalid_id_format(self, test_client, mock_fhir_client_dependency):
-        """Test patient retrieval with invalid ID format."""
+    @pytest.mark.parametrize("patient_id,fhir_error,expected_status,fragment", [
+        pytest.param("nonexistent-patient", _EXC_NOT_FOUND, _NOT_FOUND, "Patient not found", id="not-found"),
+        pytest.param("test-patient-123", _EXC_FORBIDDEN, _FORBIDDEN, "Access denied", id="forbidden"),
+        pytest.param("test-patient-123", _EXC_SERVER, _SERVER_ERROR, "FHIR server error", id="server-error"),
+        # FastAPI returns 404 for empty path params before the handler runs
+        pytest.param("", _EXC_INVALID, _NOT_FOUND, None, id="invalid-id-format"),
+    ])
+    async def test_get_patient_error_paths(self, get_patient_url_tmpl, module_stub_fhir_client, patient_id,
+                                           fhir_error, expected_status, fragment):
+        """Test patient retrieval error scenarios."""
         # Arrange
-        invalid_patient_id = ""
-        mock_fhir_client_dependency.get_patient.side_effect = FHIRException(400, "Invalid patient ID")
+        module_stub_fhir_client.errors["get_patient"] = fhir_error
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{invalid_patient_id}")
+        status_code, body = await asgi_call("GET", get_patient_url_tmpl.format(pid=patient_id))
         
         # Assert
-        assert response.status_code == status.HTTP_404_NOT_FOUND  # FastAPI returns 404 for empty path params
+        assert status_code == expected_status
+        if fragment is not None:
+            data = orjson.loads(body)
+            assert data["error"] == "FHIR_ERROR"
+            assert fragment in data["message"]
 
 
 class TestPatientMatchEndpoint:
     """Test patient matching endpoint."""
 
-    def test_match_patient_success(self, test_client, mock_fhir_client_dependency):
-        """Test successful patient matching."""
-        # Arrange
-        from datetime import date
-        match_request_data = {
-            "family": "Doe",
-            "given": "John",
-            "birth_date": "1980-01-01",
-            "phone": "+1-555-123-4567"
-        }
-        
-        expected_match_response = PatientMatchResponse(
-            resourceType="Bundle",
-            total=1,
-            entry=[
-                PatientMatchResult(
-                    resource=PatientResponse(
-                        id="test-patient-123",
-                        active=True,
-                        gender="male",
-                        birth_date=date(1980, 1, 1),
-                        primary_address="123 Main St",
-                        city="Anytown",
-                        state="CA",
-                        postal_code="12345",
-                        height_cm=175.0,
-                        weight_kg=70.0,
-                        primary_name="John Doe",
-                        primary_phone="+1-555-123-4567"
-                    ),
-                    search={"score": 1.0}
-                )
-            ]
-        )
-        
-        mock_fhir_client_dependency.match_patient.return_value = expected_match_response
-        
-        # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=match_request_data
-        )
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["resourceType"] == "Bundle"
-        assert data["total"] == 1
-        assert len(data["entry"]) == 1
-        
-        # Verify the mock was called with correct PatientMatchRequest
-        mock_fhir_client_dependency.match_patient.assert_called_once()
-        call_args = mock_fhir_client_dependency.match_patient.call_args[0]
-        match_request = call_args[0]
-        assert match_request.family == "Doe"
-        assert match_request.given == "John"
-        assert match_request.birth_date == "1980-01-01"
-        assert match_request.phone == "+1-555-123-4567"
-
-    def test_match_patient_no_matches(self, test_client, mock_fhir_client_dependency):
-        """Test patient matching with no results."""
-        # Arrange
-        match_request_data = {
-            "family": "Nonexistent",
-            "given": "Patient",
-            "birth_date": "1900-01-01"
-        }
-        
-        expected_match_response = PatientMatchResponse(
-            resourceType="Bundle",
-            total=0,
-            entry=[]
-        )
-        
-        mock_fhir_client_dependency.match_patient.return_value = expected_match_response
+    async def test_match_patient_results(self, match_url, module_stub_fhir_client, expected_match_requests,
+                                         single_match_bundle, empty_match_bundle, three_match_bundle):
+        """Test patient matching with zero, one and several results."""
+        # Arrange: the stub picks each bundle by family name, so the three
+        # requests are independent and can be posted concurrently
+        scenarios = [
+            # (payload, expected_request, bundle, expected_total, expected_scores)
+            (PAYLOAD_MATCH_BASIC, expected_match_requests[PAYLOAD_MATCH_BASIC], single_match_bundle, 1, None),
+            (PAYLOAD_MATCH_NONE, expected_match_requests[PAYLOAD_MATCH_NONE], empty_match_bundle, 0, None),
+            # Scores are included and in descending order
+            (PAYLOAD_MATCH_SMITH, expected_match_requests[PAYLOAD_MATCH_SMITH], three_match_bundle, 3,
+             EXPECTED_MATCH_SCORES),
+        ]
+        bundles = {expected_request.family: bundle for _, expected_request, bundle, _, _ in scenarios}
+        module_stub_fhir_client.handlers["match_patient"] = lambda match_request: bundles[match_request.family]
         
         # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=match_request_data
-        )
+        results = await asyncio.gather(*(
+            asgi_call("POST", match_url, payload) for payload, *_ in scenarios
+        ))
         
         # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["total"] == 0
-        assert len(data["entry"]) == 0
+        for (_, _, _, expected_total, expected_scores), (status_code, body) in zip(scenarios, results):
+            assert status_code == _OK
+            data = orjson.loads(body)
+            assert data["resourceType"] == "Bundle"
+            assert data["total"] == expected_total
+            assert len(data["entry"]) == expected_total
+            if expected_scores is not None:
+                assert [entry["search"]["score"] for entry in data["entry"]] == expected_scores
+        
+        # Verify the stub was called with the PatientMatchRequest built from each payload
+        match_calls = module_stub_fhir_client.calls_to("match_patient")
+        assert len(match_calls) == len(scenarios)
+        for _, expected_request, *_ in scenarios:
+            assert (expected_request,) in match_calls
 
-    def test_match_patient_missing_required_fields(self, test_client, mock_fhir_client_dependency):
+    async def test_match_patient_missing_required_fields(self, match_url, module_stub_fhir_client):
         """Test patient matching with missing required fields."""
-        # Arrange
-        invalid_request_data = {
-            "family": "Doe"
-            # Missing required fields: given, birth_date
-        }
-        
         # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=invalid_request_data
-        )
+        status_code, body = await asgi_call("POST", match_url, PAYLOAD_MATCH_MISSING_FIELDS)
         
         # Assert
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        data = response.json()
+        assert status_code == _UNPROCESSABLE
+        data = orjson.loads(body)
         assert "detail" in data
         # Pydantic validation should catch missing required fields
-        error_fields = [error.get("loc", [])[-1] if error.get("loc") else str(error) for error in data["detail"]]
-        assert "given" in error_fields
-        assert "birth_date" in error_fields or "birthDate" in error_fields
+        error_fields = {error["loc"][-1] for error in data["detail"] if error.get("loc")}
+        assert {"given"} & error_fields
+        assert error_fields & {"birth_date", "birthDate"}
 
-    def test_match_patient_invalid_date_format(self, test_client, mock_fhir_client_dependency):
-        """Test patient matching with invalid date format."""
-        # For this test, the FHIR client should not be called since validation should fail first
-        # But if it is called, we need to ensure the mock returns valid data
-        expected_match_response = PatientMatchResponse(
-            resourceType="Bundle",
-            total=0,
-            entry=[]
-        )
-        mock_fhir_client_dependency.match_patient.return_value = expected_match_response
-        
-        # Arrange
-        invalid_request_data = {
-            "family": "Doe",
-            "given": "John",
-            "birth_date": "invalid-date-format"
-        }
+    async def test_match_patient_invalid_date_format(self, match_url, module_stub_fhir_client, empty_match_bundle):
+        """Test patient matching with a non-ISO birth date string."""
+        # Arrange: PatientMatchRequest.birth_date is a plain str, so the value
+        # passes validation and is forwarded to the FHIR client unchanged
+        module_stub_fhir_client.returns["match_patient"] = empty_match_bundle
         
         # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=invalid_request_data
-        )
+        status_code, body = await asgi_call("POST", match_url, PAYLOAD_MATCH_INVALID_DATE)
         
         # Assert
-        # Note: This might pass validation if the date field is just treated as a string
-        # In that case, we should expect a successful response
-        if response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY:
-            data = response.json()
-            assert "detail" in data
-            assert len(data["detail"]) > 0
-        else:
-            # If validation passes, the endpoint should work normally
-            assert response.status_code == status.HTTP_200_OK
+        assert status_code == _OK
+        (match_request,) = module_stub_fhir_client.calls_to("match_patient")[-1]
+        assert match_request.birth_date == "invalid-date-format"
 
-    def test_match_patient_with_address(self, test_client, mock_fhir_client_dependency):
+    async def test_match_patient_with_address(self, match_url, module_stub_fhir_client, expected_match_requests,
+                                              single_match_bundle):
         """Test patient matching with optional address field."""
         # Arrange
-        match_request_data = {
-            "family": "Doe",
-            "given": "John",
-            "birth_date": "1980-01-01",
-            "address": {
-                "line": ["123 Main St"],
-                "city": "Anytown",
-                "state": "CA",
-                "postalCode": "12345"
-            }
-        }
-        
-        from datetime import date
-        expected_match_response = PatientMatchResponse(
-            resourceType="Bundle",
-            total=1,
-            entry=[
-                PatientMatchResult(
-                    resource=PatientResponse(
-                        id="test-patient-123",
-                        active=True,
-                        gender="male",
-                        birth_date=date(1980, 1, 1),
-                        primary_address="123 Main St",
-                        city="Anytown",
-                        state="CA",
-                        postal_code="12345",
-                        height_cm=175.0,
-                        weight_kg=70.0,
-                        primary_name="John Doe",
-                        primary_phone="+1-555-123-4567"
-                    )
-                )
-            ]
-        )
-        
-        mock_fhir_client_dependency.match_patient.return_value = expected_match_response
+        module_stub_fhir_client.returns["match_patient"] = single_match_bundle
         
         # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=match_request_data
-        )
+        status_code, body = await asgi_call("POST", match_url, PAYLOAD_MATCH_ADDRESS)
         
         # Assert
-        assert response.status_code == status.HTTP_200_OK
+        assert status_code == _OK
         
         # Verify address was included in the request
-        call_args = mock_fhir_client_dependency.match_patient.call_args[0]
-        match_request = call_args[0]
-        assert match_request.address is not None
-        assert match_request.address.city == "Anytown"
+        match_calls = module_stub_fhir_client.calls_to("match_patient")
+        assert match_calls == [(expected_match_requests[PAYLOAD_MATCH_ADDRESS],)]
+        assert match_calls[0][0].address.city == "Anytown"
 
-    def test_match_patient_fhir_error(self, test_client, mock_fhir_client_dependency):
+    async def test_match_patient_fhir_error(self, match_url, module_stub_fhir_client):
         """Test patient matching with FHIR service error."""
         # Arrange
-        match_request_data = {
-            "family": "Doe",
-            "given": "John",
-            "birth_date": "1980-01-01"
-        }
-        
-        mock_fhir_client_dependency.match_patient.side_effect = FHIRException(500, "FHIR service unavailable")
+        module_stub_fhir_client.errors["match_patient"] = _EXC_SERVICE_UNAVAIL
         
         # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=match_request_data
-        )
+        status_code, body = await asgi_call("POST", match_url, PAYLOAD_MATCH_DOE)
         
         # Assert
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
+        assert status_code == _SERVER_ERROR
+        data = orjson.loads(body)
         assert data["error"] == "FHIR_ERROR"
         assert "FHIR service unavailable" in data["message"]
 
-    def test_match_patient_multiple_matches(self, test_client, mock_fhir_client_dependency):
-        """Test patient matching with multiple results."""
-        # Arrange
-        match_request_data = {
-            "family": "Smith",
-            "given": "John",
-            "birth_date": "1980-01-01"
-        }
-        
-        expected_match_response = PatientMatchResponse(
-            resourceType="Bundle",
-            total=3,
-            entry=[
-                PatientMatchResult(
-                    resource=PatientResponse(id="patient-1", primary_name="John Smith"),
-                    search={"score": 1.0}
-                ),
-                PatientMatchResult(
-                    resource=PatientResponse(id="patient-2", primary_name="John Smith"),
-                    search={"score": 0.9}
-                ),
-                PatientMatchResult(
-                    resource=PatientResponse(id="patient-3", primary_name="John Smith"),
-                    search={"score": 0.8}
-                )
-            ]
-        )
-        
-        mock_fhir_client_dependency.match_patient.return_value = expected_match_response
-        
-        # Act
-        response = test_client.post(
-            "/api/v1/sepsis-alert/patients/match",
-            json=match_request_data
-        )
-        
-        # Assert
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["total"] == 3
-        assert len(data["entry"]) == 3
-        
-        # Verify scores are included and in descending order
-        scores = [entry["search"]["score"] for entry in data["entry"]]
-        assert scores == [1.0, 0.9, 0.8]
\ No newline at end of file
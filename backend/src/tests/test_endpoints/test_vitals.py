@@ -2,222 +2,248 @@
 Integration tests for vitals endpoints.
 """
 
+import orjson
 import pytest
 from fastapi import status
 from datetime import datetime
-from unittest.mock import AsyncMock
 
-from app.models.vitals import VitalSignsResponse, VitalSignsLatestResponse, VitalSignsTimeSeries, VitalSignsData, VitalSign, BloodPressure
+from app.models.vitals import BloodPressure
 from app.core.exceptions import FHIRException
+from tests.fixtures.json_paths import as_json, assert_fhir_error
+
+# The xdist group keeps this module on one worker under --dist=loadgroup, so the
+# session-scoped clients and the module's FHIR client stub are built once for it.
+pytestmark = [pytest.mark.asyncio, pytest.mark.xdist_group("vitals_endpoints")]
+
+SAMPLE_PATIENT_ID = "test-patient-123"
+_T0 = datetime(2023, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def vitals_url(vitals_url_tmpl, sample_patient_id):
+    """Vitals path for the sample patient."""
+    return vitals_url_tmpl.format(pid=sample_patient_id)
+
+
+@pytest.fixture(scope="module")
+def latest_vitals_url(latest_vitals_url_tmpl, sample_patient_id):
+    """Latest-vitals path for the sample patient."""
+    return latest_vitals_url_tmpl.format(pid=sample_patient_id)
+
+
+@pytest.fixture(scope="module")
+def vitals_response(sample_patient_id, vitals_response_factory, vital_sign_factory):
+    """Heart rate and blood pressure time series for the default vitals query."""
+    return vitals_response_factory(
+        sample_patient_id,
+        total_entries=3,
+        heart_rate=[
+            vital_sign_factory(72.0, "beats/min", "8867-4", _T0, "Heart rate")
+        ],
+        blood_pressure=[
+            BloodPressure.model_construct(
+                systolic=vital_sign_factory(120.0, "mmHg", "8480-6", _T0, "Systolic blood pressure"),
+                diastolic=vital_sign_factory(80.0, "mmHg", "8462-4", _T0, "Diastolic blood pressure")
+            )
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def vitals_payload(vitals_response):
+    """Expected JSON body for vitals_response, computed fields included."""
+    return orjson.loads(vitals_response.model_dump_json())
+
+
+@pytest.fixture(scope="module")
+def full_vitals_response(sample_patient_id, vitals_response_factory, vital_sign_factory):
+    """One reading for every vital sign type."""
+    return vitals_response_factory(
+        sample_patient_id,
+        total_entries=6,
+        heart_rate=[vital_sign_factory(72.0, "beats/min", "8867-4", _T0)],
+        respiratory_rate=[vital_sign_factory(16.0, "breaths/min", "9279-1", _T0)],
+        body_temperature=[vital_sign_factory(98.6, "°F", "8310-5", _T0)],
+        oxygen_saturation=[vital_sign_factory(98.0, "%", "2708-6", _T0)],
+        glasgow_coma_score=[vital_sign_factory(15.0, "", "9269-2", _T0)],
+        blood_pressure=[
+            BloodPressure.model_construct(
+                systolic=vital_sign_factory(120.0, "mmHg", "8480-6", _T0),
+                diastolic=vital_sign_factory(80.0, "mmHg", "8462-4", _T0)
+            )
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def latest_vitals_response(sample_patient_id, latest_vitals_factory, vital_sign_factory):
+    """Latest heart rate and blood pressure readings."""
+    return latest_vitals_factory(
+        sample_patient_id,
+        last_updated=_T0,
+        heart_rate=vital_sign_factory(75.0, "beats/min", "8867-4", _T0, "Heart rate"),
+        blood_pressure=BloodPressure.model_construct(
+            systolic=vital_sign_factory(125.0, "mmHg", "8480-6", _T0, "Systolic blood pressure"),
+            diastolic=vital_sign_factory(82.0, "mmHg", "8462-4", _T0, "Diastolic blood pressure")
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def latest_vitals_payload(latest_vitals_response):
+    """Expected JSON body for latest_vitals_response, computed fields included."""
+    return orjson.loads(latest_vitals_response.model_dump_json())
+
+
+@pytest.fixture(scope="module")
+def full_latest_vitals_response(sample_patient_id, latest_vitals_factory, vital_sign_factory):
+    """Latest reading for every vital sign type."""
+    return latest_vitals_factory(
+        sample_patient_id,
+        last_updated=_T0,
+        heart_rate=vital_sign_factory(72.0, "beats/min", "8867-4", _T0),
+        respiratory_rate=vital_sign_factory(16.0, "breaths/min", "9279-1", _T0),
+        body_temperature=vital_sign_factory(98.6, "°F", "8310-5", _T0),
+        oxygen_saturation=vital_sign_factory(98.0, "%", "2708-6", _T0),
+        glasgow_coma_score=vital_sign_factory(15.0, "", "9269-2", _T0),
+        blood_pressure=BloodPressure.model_construct(
+            systolic=vital_sign_factory(120.0, "mmHg", "8480-6", _T0),
+            diastolic=vital_sign_factory(80.0, "mmHg", "8462-4", _T0)
+        )
+    )
 
 
 class TestVitalsEndpoints:
     """Test vitals-related API endpoints."""
 
-    def test_get_vitals_success(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_vitals_success(self, orjson_client, module_stub_fhir_client, vitals_url, sample_patient_id,
+                                      vitals_response, vitals_payload):
         """Test successful vitals retrieval."""
         # Arrange
-        expected_vitals_data = VitalSignsResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsTimeSeries(
-                heart_rate=[
-                    VitalSign(
-                        value=72.0,
-                        unit="beats/min",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="8867-4",
-                        display_name="Heart rate"
-                    )
-                ],
-                blood_pressure=[
-                    BloodPressure(
-                        systolic=VitalSign(
-                            value=120.0,
-                            unit="mmHg",
-                            timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                            loinc_code="8480-6",
-                            display_name="Systolic blood pressure"
-                        ),
-                        diastolic=VitalSign(
-                            value=80.0,
-                            unit="mmHg",
-                            timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                            loinc_code="8462-4",
-                            display_name="Diastolic blood pressure"
-                        )
-                    )
-                ]
-            ),
-            total_entries=3,
-            date_range=None
-        )
-        
-        mock_fhir_client_dependency.get_vitals.return_value = expected_vitals_data
+        module_stub_fhir_client.returns["get_vitals"] = vitals_response
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals")
+        response = await orjson_client.get(vitals_url)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert data["total_entries"] == 3
-        assert "vital_signs" in data
-        assert len(data["vital_signs"]["heart_rate"]) == 1
-        assert data["vital_signs"]["heart_rate"][0]["value"] == 72.0
+        assert as_json(response) == vitals_payload
         
-        mock_fhir_client_dependency.get_vitals.assert_called_once_with(
-            sample_patient_id, None, None, None
-        )
+        assert module_stub_fhir_client.calls_to("get_vitals") == [(sample_patient_id, None, None, None)]
 
-    def test_get_vitals_with_date_range(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_vitals_with_date_range(self, routing_client, module_stub_fhir_client, vitals_url,
+                                              sample_patient_id, vitals_response_factory):
         """Test vitals retrieval with date range parameters."""
         # Arrange
         start_date = "2023-01-01T00:00:00"
         end_date = "2023-01-02T23:59:59"
         
-        expected_vitals_data = VitalSignsResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsTimeSeries(),
-            total_entries=0,
+        expected_vitals_data = vitals_response_factory(
+            sample_patient_id,
             date_range={"start": datetime(2023, 1, 1), "end": datetime(2023, 1, 2, 23, 59, 59)}
         )
         
-        mock_fhir_client_dependency.get_vitals.return_value = expected_vitals_data
+        module_stub_fhir_client.returns["get_vitals"] = expected_vitals_data
         
         # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals",
+        response = await routing_client.get(
+            vitals_url,
             params={"start_date": start_date, "end_date": end_date}
         )
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         assert data["patient_id"] == sample_patient_id
         assert data["date_range"] is not None
         
-        # Verify the FHIR client was called with parsed datetime objects
-        call_args = mock_fhir_client_dependency.get_vitals.call_args[0]
+        # Verify the FHIR client was called once with parsed datetime objects
+        (call_args,) = module_stub_fhir_client.calls_to("get_vitals")
         assert isinstance(call_args[1], datetime)  # start_date
         assert isinstance(call_args[2], datetime)  # end_date
 
-    def test_get_vitals_with_vital_type_filter(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_vitals_with_vital_type_filter(self, routing_client, module_stub_fhir_client, vitals_url,
+                                                     sample_patient_id, vitals_response_factory, vital_sign_factory):
         """Test vitals retrieval with specific vital type filter."""
         # Arrange
         vital_type = "HR"  # Heart Rate only
         
-        expected_vitals_data = VitalSignsResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsTimeSeries(
-                heart_rate=[
-                    VitalSign(
-                        value=75.0,
-                        unit="beats/min",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="8867-4",
-                        display_name="Heart rate"
-                    )
-                ]
-            ),
+        expected_vitals_data = vitals_response_factory(
+            sample_patient_id,
             total_entries=1,
-            date_range=None
+            heart_rate=[
+                vital_sign_factory(75.0, "beats/min", "8867-4", _T0, "Heart rate")
+            ]
         )
         
-        mock_fhir_client_dependency.get_vitals.return_value = expected_vitals_data
+        module_stub_fhir_client.returns["get_vitals"] = expected_vitals_data
         
         # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals",
+        response = await routing_client.get(
+            vitals_url,
             params={"vital_type": vital_type}
         )
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         assert data["patient_id"] == sample_patient_id
         assert len(data["vital_signs"]["heart_rate"]) == 1
         assert len(data["vital_signs"]["blood_pressure"]) == 0  # Should be empty
         
-        mock_fhir_client_dependency.get_vitals.assert_called_once_with(
-            sample_patient_id, None, None, vital_type
-        )
-
-    def test_get_vitals_patient_not_found(self, test_client, mock_fhir_client_dependency):
-        """Test vitals retrieval for non-existent patient."""
-        # Arrange
-        patient_id = "nonexistent-patient"
-        mock_fhir_client_dependency.get_vitals.side_effect = FHIRException(404, "Patient not found")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}/vitals")
-        
-        # Assert
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Patient not found" in data["message"]
+        assert module_stub_fhir_client.calls_to("get_vitals") == [(sample_patient_id, None, None, vital_type)]
 
-    def test_get_vitals_access_denied(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test vitals retrieval with access denied."""
+    @pytest.mark.parametrize("patient_id,status_code,message,fragment", [
+        pytest.param("nonexistent-patient", status.HTTP_404_NOT_FOUND,
+                     "Patient not found", "Patient not found", id="not_found"),
+        pytest.param(SAMPLE_PATIENT_ID, status.HTTP_403_FORBIDDEN,
+                     "Access denied to patient vitals", "Access denied", id="forbidden"),
+    ])
+    async def test_fhir_error_propagation(self, orjson_client, module_stub_fhir_client, vitals_url_tmpl, patient_id,
+                                          status_code, message, fragment):
+        """Test FHIR errors from vitals retrieval map to FHIR_ERROR responses."""
         # Arrange
-        mock_fhir_client_dependency.get_vitals.side_effect = FHIRException(403, "Access denied to patient vitals")
+        module_stub_fhir_client.errors["get_vitals"] = FHIRException(status_code, message)
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals")
+        response = await orjson_client.get(vitals_url_tmpl.format(pid=patient_id))
         
         # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Access denied" in data["message"]
+        assert_fhir_error(response, status_code, fragment)
 
-    def test_get_vitals_invalid_date_format(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test vitals retrieval with invalid date format."""
-        # Arrange
-        invalid_start_date = "invalid-date"
-        
+    @pytest.mark.parametrize("invalid_start_date", [
+        "invalid-date",
+        "2023-13-01",
+        "2023/01/01",
+        "",
+        "2023-01-01T25:00:00",
+        "yesterday",
+    ])
+    async def test_get_vitals_invalid_date_format(self, validation_client, vitals_url, invalid_start_date):
+        """Test vitals retrieval rejects malformed start dates."""
         # Act
-        response = test_client.get(
-            f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals",
+        response = await validation_client.get(
+            vitals_url,
             params={"start_date": invalid_start_date}
         )
         
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-        data = response.json()
+        data = as_json(response)
         assert "detail" in data
 
-    def test_get_vitals_all_vital_types(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_vitals_all_vital_types(self, orjson_client, module_stub_fhir_client, vitals_url,
+                                              full_vitals_response):
         """Test vitals retrieval for all vital sign types."""
         # Arrange
-        expected_vitals_data = VitalSignsResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsTimeSeries(
-                heart_rate=[VitalSign(value=72.0, unit="beats/min", timestamp=datetime.now(), loinc_code="8867-4")],
-                respiratory_rate=[VitalSign(value=16.0, unit="breaths/min", timestamp=datetime.now(), loinc_code="9279-1")],
-                body_temperature=[VitalSign(value=98.6, unit="°F", timestamp=datetime.now(), loinc_code="8310-5")],
-                oxygen_saturation=[VitalSign(value=98.0, unit="%", timestamp=datetime.now(), loinc_code="2708-6")],
-                glasgow_coma_score=[VitalSign(value=15.0, unit="", timestamp=datetime.now(), loinc_code="9269-2")],
-                blood_pressure=[
-                    BloodPressure(
-                        systolic=VitalSign(value=120.0, unit="mmHg", timestamp=datetime.now(), loinc_code="8480-6"),
-                        diastolic=VitalSign(value=80.0, unit="mmHg", timestamp=datetime.now(), loinc_code="8462-4")
-                    )
-                ]
-            ),
-            total_entries=6,
-            date_range=None
-        )
-        
-        mock_fhir_client_dependency.get_vitals.return_value = expected_vitals_data
+        module_stub_fhir_client.returns["get_vitals"] = full_vitals_response
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals")
+        response = await orjson_client.get(vitals_url)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         assert data["total_entries"] == 6
         
         # Verify all vital sign types are present
@@ -233,166 +259,96 @@ class TestVitalsEndpoints:
 class TestLatestVitalsEndpoint:
     """Test latest vitals endpoint."""
 
-    def test_get_latest_vitals_success(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_latest_vitals_success(self, orjson_client, module_stub_fhir_client, latest_vitals_url,
+                                             sample_patient_id, latest_vitals_response, latest_vitals_payload):
         """Test successful latest vitals retrieval."""
         # Arrange
-        expected_latest_vitals = VitalSignsLatestResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsData(
-                heart_rate=VitalSign(
-                    value=75.0,
-                    unit="beats/min",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="8867-4",
-                    display_name="Heart rate"
-                ),
-                blood_pressure=BloodPressure(
-                    systolic=VitalSign(
-                        value=125.0,
-                        unit="mmHg",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="8480-6",
-                        display_name="Systolic blood pressure"
-                    ),
-                    diastolic=VitalSign(
-                        value=82.0,
-                        unit="mmHg",
-                        timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                        loinc_code="8462-4",
-                        display_name="Diastolic blood pressure"
-                    )
-                )
-            ),
-            last_updated=datetime(2023, 1, 1, 12, 0, 0)
-        )
-        
-        mock_fhir_client_dependency.get_latest_vitals.return_value = expected_latest_vitals
+        module_stub_fhir_client.returns["get_latest_vitals"] = latest_vitals_response
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals/latest")
+        response = await orjson_client.get(latest_vitals_url)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert data["patient_id"] == sample_patient_id
-        assert data["vital_signs"]["heart_rate"]["value"] == 75.0
-        assert data["vital_signs"]["blood_pressure"]["systolic"]["value"] == 125.0
-        assert data["vital_signs"]["blood_pressure"]["diastolic"]["value"] == 82.0
+        assert as_json(response) == latest_vitals_payload
         
-        mock_fhir_client_dependency.get_latest_vitals.assert_called_once_with(sample_patient_id)
+        assert module_stub_fhir_client.calls_to("get_latest_vitals") == [(sample_patient_id,)]
 
-    def test_get_latest_vitals_partial_data(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_latest_vitals_partial_data(self, orjson_client, module_stub_fhir_client, latest_vitals_url,
+                                                  sample_patient_id, latest_vitals_factory, vital_sign_factory):
         """Test latest vitals retrieval with partial data (some vitals missing)."""
         # Arrange
-        expected_latest_vitals = VitalSignsLatestResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsData(
-                heart_rate=VitalSign(
-                    value=80.0,
-                    unit="beats/min",
-                    timestamp=datetime(2023, 1, 1, 12, 0, 0),
-                    loinc_code="8867-4"
-                ),
-                # Other vitals are None/missing
-                blood_pressure=None,
-                body_temperature=None,
-                respiratory_rate=None,
-                oxygen_saturation=None,
-                glasgow_coma_score=None
-            ),
-            last_updated=datetime(2023, 1, 1, 12, 0, 0)
+        # Only heart rate is present; the other readings default to None
+        expected_latest_vitals = latest_vitals_factory(
+            sample_patient_id,
+            last_updated=_T0,
+            heart_rate=vital_sign_factory(80.0, "beats/min", "8867-4", _T0)
         )
         
-        mock_fhir_client_dependency.get_latest_vitals.return_value = expected_latest_vitals
+        module_stub_fhir_client.returns["get_latest_vitals"] = expected_latest_vitals
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals/latest")
+        response = await orjson_client.get(latest_vitals_url)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         assert data["patient_id"] == sample_patient_id
         assert data["vital_signs"]["heart_rate"]["value"] == 80.0
         assert data["vital_signs"]["blood_pressure"] is None
         assert data["vital_signs"]["body_temperature"] is None
 
-    def test_get_latest_vitals_no_data(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_latest_vitals_no_data(self, orjson_client, module_stub_fhir_client, latest_vitals_url,
+                                             sample_patient_id, latest_vitals_factory):
         """Test latest vitals retrieval with no vital signs data."""
         # Arrange
-        expected_latest_vitals = VitalSignsLatestResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsData(),  # All vitals are None
-            last_updated=datetime(2023, 1, 1, 12, 0, 0)
+        expected_latest_vitals = latest_vitals_factory(
+            sample_patient_id,
+            last_updated=_T0  # All vitals are None
         )
         
-        mock_fhir_client_dependency.get_latest_vitals.return_value = expected_latest_vitals
+        module_stub_fhir_client.returns["get_latest_vitals"] = expected_latest_vitals
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals/latest")
+        response = await orjson_client.get(latest_vitals_url)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         assert data["patient_id"] == sample_patient_id
         assert data["vital_signs"]["heart_rate"] is None
         assert data["vital_signs"]["blood_pressure"] is None
 
-    def test_get_latest_vitals_patient_not_found(self, test_client, mock_fhir_client_dependency):
-        """Test latest vitals retrieval for non-existent patient."""
+    @pytest.mark.parametrize("patient_id,status_code,message,fragment", [
+        pytest.param("nonexistent-patient", status.HTTP_404_NOT_FOUND,
+                     "Patient not found", "Patient not found", id="not_found"),
+        pytest.param(SAMPLE_PATIENT_ID, status.HTTP_500_INTERNAL_SERVER_ERROR,
+                     "FHIR server unavailable", "FHIR server unavailable", id="server_error"),
+    ])
+    async def test_fhir_error_propagation(self, orjson_client, module_stub_fhir_client, latest_vitals_url_tmpl,
+                                          patient_id, status_code, message, fragment):
+        """Test FHIR errors from latest vitals retrieval map to FHIR_ERROR responses."""
         # Arrange
-        patient_id = "nonexistent-patient"
-        mock_fhir_client_dependency.get_latest_vitals.side_effect = FHIRException(404, "Patient not found")
+        module_stub_fhir_client.errors["get_latest_vitals"] = FHIRException(status_code, message)
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{patient_id}/vitals/latest")
+        response = await orjson_client.get(latest_vitals_url_tmpl.format(pid=patient_id))
         
         # Assert
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "Patient not found" in data["message"]
+        assert_fhir_error(response, status_code, fragment)
 
-    def test_get_latest_vitals_server_error(self, test_client, mock_fhir_client_dependency, sample_patient_id):
-        """Test latest vitals retrieval with server error."""
-        # Arrange
-        mock_fhir_client_dependency.get_latest_vitals.side_effect = FHIRException(500, "FHIR server unavailable")
-        
-        # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals/latest")
-        
-        # Assert
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-        data = response.json()
-        assert data["error"] == "FHIR_ERROR"
-        assert "FHIR server unavailable" in data["message"]
-
-    def test_get_latest_vitals_complete_data(self, test_client, mock_fhir_client_dependency, sample_patient_id):
+    async def test_get_latest_vitals_complete_data(self, orjson_client, module_stub_fhir_client,
+                                                   latest_vitals_url, full_latest_vitals_response):
         """Test latest vitals retrieval with complete vital signs data."""
         # Arrange
-        expected_latest_vitals = VitalSignsLatestResponse(
-            patient_id=sample_patient_id,
-            vital_signs=VitalSignsData(
-                heart_rate=VitalSign(value=72.0, unit="beats/min", timestamp=datetime.now(), loinc_code="8867-4"),
-                respiratory_rate=VitalSign(value=16.0, unit="breaths/min", timestamp=datetime.now(), loinc_code="9279-1"),
-                body_temperature=VitalSign(value=98.6, unit="°F", timestamp=datetime.now(), loinc_code="8310-5"),
-                oxygen_saturation=VitalSign(value=98.0, unit="%", timestamp=datetime.now(), loinc_code="2708-6"),
-                glasgow_coma_score=VitalSign(value=15.0, unit="", timestamp=datetime.now(), loinc_code="9269-2"),
-                blood_pressure=BloodPressure(
-                    systolic=VitalSign(value=120.0, unit="mmHg", timestamp=datetime.now(), loinc_code="8480-6"),
-                    diastolic=VitalSign(value=80.0, unit="mmHg", timestamp=datetime.now(), loinc_code="8462-4")
-                )
-            ),
-            last_updated=datetime.now()
-        )
-        
-        mock_fhir_client_dependency.get_latest_vitals.return_value = expected_latest_vitals
+        module_stub_fhir_client.returns["get_latest_vitals"] = full_latest_vitals_response
         
         # Act
-        response = test_client.get(f"/api/v1/sepsis-alert/patients/{sample_patient_id}/vitals/latest")
+        response = await orjson_client.get(latest_vitals_url)
         
         # Assert
         assert response.status_code == status.HTTP_200_OK
-        data = response.json()
+        data = as_json(response)
         
         # Verify all vital signs are present
         vital_signs = data["vital_signs"]
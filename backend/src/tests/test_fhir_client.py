@@ -4,11 +4,16 @@ Unit tests for the FHIR client.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+import requests
+from contextlib import ExitStack
+from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
 from app.services.fhir_client import FHIRClient
 from app.core.exceptions import FHIRException
+from app.models.labs import LabResultsData
+from app.models.patient import PatientResponse
+from app.models.vitals import VitalSignsTimeSeries
 from tests.fixtures.fhir_responses import (
     patient_response, 
     bundle_response, 
@@ -17,128 +22,172 @@ from tests.fixtures.fhir_responses import (
     operation_outcome_error
 )
 
+PATIENT_123 = {"resourceType": "Patient", "id": "test-123"}
+
+# FHIR payloads built once at import; FHIRClient only reads them.
+PATIENT = patient_response()
+PATIENT_BUNDLE = bundle_response([PATIENT])
+TWO_PATIENT_BUNDLE = bundle_response([PATIENT, patient_response("patient-456")])
+NEXT_PAGE_URL = "https://fhir.server/Patient?_getpages=page2"
+PAGE1_BUNDLE = {
+    **bundle_response([patient_response("patient-1")]),
+    "link": [{"relation": "next", "url": NEXT_PAGE_URL}]
+}
+PAGE2_BUNDLE = bundle_response([patient_response("patient-2")])
+HEIGHT_WEIGHT_BUNDLE = bundle_response([
+    {"resourceType": "Observation", "id": "height-obs-123",
+     "code": {"coding": [{"system": "http://loinc.org", "code": "8302-2"}]}},
+    {"resourceType": "Observation", "id": "weight-obs-123",
+     "code": {"coding": [{"system": "http://loinc.org", "code": "29463-7"}]}}
+])
+VITALS_BUNDLE = vitals_bundle_response()
+ERR_403 = operation_outcome_error("error", "forbidden", "Access denied to patient data")
+ERR_500 = operation_outcome_error("error", "exception", "Internal server error")
+
+
+def _areturn(value):
+    """
+    Build a coroutine-function stub that returns ``value`` on every await.
+
+    Lighter than ``AsyncMock`` for return-only cases; each call's
+    ``(args, kwargs)`` is appended to the stub's ``calls`` list.
+    """
+    calls = []
+
+    async def _stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        return value
+
+    _stub.calls = calls
+    return _stub
+
+
+def _aseq(*values):
+    """
+    Build a coroutine-function stub that returns ``values`` one per await.
+
+    Mirrors an ``AsyncMock`` side_effect list, including raising
+    StopAsyncIteration once exhausted; calls are recorded like ``_areturn``.
+    """
+    calls = []
+    remaining = iter(values)
+
+    async def _stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        try:
+            return next(remaining)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    _stub.calls = calls
+    return _stub
+
+
+# Canned HTTP responses are built once per module; MockResponse is never
+# mutated by FHIRClient, so tests can share them.
+@pytest.fixture(scope="module")
+def patient_ok_response(create_mock_response):
+    """200 OK carrying PATIENT_123."""
+    return create_mock_response(200, PATIENT_123)
+
+
+@pytest.fixture(scope="module")
+def unauthorized_response(create_mock_response):
+    """401 Unauthorized that should trigger a token refresh."""
+    return create_mock_response(401, {"error": "unauthorized"}, ok=False)
+
 
 class TestFHIRClientMakeRequest:
     """Test the core _make_request method with various HTTP scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_make_request_success_200(self, fhir_client_with_mocks, create_mock_response):
+    pytestmark = pytest.mark.asyncio
+
+    async def test_make_request_success_200(self, fhir_client_with_mocks, fhir_backend):
         """Test successful 200 OK response returns JSON data."""
         # Arrange
-        expected_data = {"resourceType": "Patient", "id": "test-123"}
-        mock_response = create_mock_response(200, expected_data)
-        fhir_client_with_mocks.session.request.return_value = mock_response
+        fhir_backend.register("GET", "Patient/test-123", PATIENT_123)
         
         # Act
         result = await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
         
         # Assert
-        assert result == expected_data
-        fhir_client_with_mocks.session.request.assert_called_once()
-        call_args = fhir_client_with_mocks.session.request.call_args
-        assert call_args[1]["method"] == "GET"
-        assert call_args[1]["url"].endswith("Patient/test-123")
+        assert result == PATIENT_123
+        assert [(method, endpoint) for method, endpoint, _ in fhir_backend.calls] == [("GET", "Patient/test-123")]
 
-    @pytest.mark.asyncio
-    async def test_make_request_401_triggers_token_refresh(self, fhir_client_with_mocks, create_mock_response):
+    async def test_make_request_401_triggers_token_refresh(self, fhir_client_with_mocks, unauthorized_response,
+                                                           patient_ok_response):
         """Test 401 Unauthorized triggers token refresh and retry."""
         # Arrange
-        expected_data = {"resourceType": "Patient", "id": "test-123"}
-        mock_response_401 = create_mock_response(401, {"error": "unauthorized"}, ok=False)
-        mock_response_200 = create_mock_response(200, expected_data)
-        
         # First call returns 401, second call returns 200
-        fhir_client_with_mocks.session.request.side_effect = [mock_response_401, mock_response_200]
+        fhir_client_with_mocks.session.request.side_effect = [unauthorized_response, patient_ok_response]
         
         # Act
         result = await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
         
         # Assert
-        assert result == expected_data
+        assert result == PATIENT_123
         assert fhir_client_with_mocks.session.request.call_count == 2
         fhir_client_with_mocks.auth_client.fetch_token.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_make_request_403_raises_fhir_exception(self, fhir_client_with_mocks, create_mock_response):
-        """Test 403 Forbidden raises FHIRException with correct status and message."""
+    @pytest.mark.usefixtures("disable_fhir_request_retries")
+    @pytest.mark.parametrize("status, error_body, expected_detail", [
+        (403, ERR_403, "Access denied to patient data"),
+        (500, ERR_500, "Internal server error"),
+        (None, None, "Network error"),
+    ], ids=["403", "500", "network-error"])
+    async def test_make_request_error_raises_fhir_exception(self, fhir_client_with_mocks, create_mock_response,
+                                                            status, error_body, expected_detail):
+        """Test HTTP error statuses and network errors raise FHIRException with the right status and message."""
         # Arrange
-        error_response = operation_outcome_error("error", "forbidden", "Access denied to patient data")
-        mock_response = create_mock_response(403, error_response, ok=False)
-        fhir_client_with_mocks.session.request.return_value = mock_response
+        if status is None:
+            network_error = requests.exceptions.ConnectionError("Connection failed")
+            fhir_client_with_mocks.session.request.side_effect = network_error
+        else:
+            fhir_client_with_mocks.session.request.return_value = create_mock_response(status, error_body, ok=False)
         
-        # Mock the retry decorator to avoid retries in tests
-        with patch.object(fhir_client_with_mocks, '_make_request') as mock_make_request:
-            mock_make_request.side_effect = FHIRException(403, "FHIR request failed: 403 - Access denied to patient data")
-            
-            # Act & Assert
-            with pytest.raises(FHIRException) as exc_info:
-                await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
-            
-            assert exc_info.value.status_code == 403
-            assert "Access denied to patient data" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_make_request_500_raises_fhir_exception(self, fhir_client_with_mocks, create_mock_response):
-        """Test 500 Server Error raises FHIRException with correct status."""
-        # Arrange
-        error_response = operation_outcome_error("error", "exception", "Internal server error")
-        mock_response = create_mock_response(500, error_response, ok=False)
-        fhir_client_with_mocks.session.request.return_value = mock_response
+        # Act & Assert
+        with pytest.raises(FHIRException) as exc_info:
+            await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
         
-        # Mock the retry decorator to avoid retries in tests
-        with patch.object(fhir_client_with_mocks, '_make_request') as mock_make_request:
-            mock_make_request.side_effect = FHIRException(500, "FHIR request failed: 500 - Internal server error")
-            
-            # Act & Assert
-            with pytest.raises(FHIRException) as exc_info:
-                await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
-            
-            assert exc_info.value.status_code == 500
-            assert "Internal server error" in exc_info.value.detail
+        assert exc_info.value.status_code == (status or 500)
+        assert expected_detail in exc_info.value.detail
 
-    @pytest.mark.asyncio
-    async def test_make_request_network_error_raises_fhir_exception(self, fhir_client_with_mocks):
-        """Test network errors raise FHIRException with network error message."""
+    @pytest.mark.usefixtures("skip_fhir_retry_backoff")
+    async def test_make_request_retries_transient_error(self, fhir_client_with_mocks, create_mock_response,
+                                                        patient_ok_response):
+        """Test the retry policy retries a transient FHIR error and returns the next successful response."""
         # Arrange
-        import requests
-        fhir_client_with_mocks.session.request.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        fhir_client_with_mocks.session.request.side_effect = [
+            create_mock_response(500, ERR_500, ok=False),
+            patient_ok_response
+        ]
         
-        # Mock the retry decorator to avoid retries in tests
-        with patch.object(fhir_client_with_mocks, '_make_request') as mock_make_request:
-            mock_make_request.side_effect = FHIRException(500, "Network error: Connection failed")
-            
-            # Act & Assert
-            with pytest.raises(FHIRException) as exc_info:
-                await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
-            
-            assert exc_info.value.status_code == 500
-            assert "Network error" in exc_info.value.detail
+        # Act
+        result = await fhir_client_with_mocks._make_request("GET", "Patient/test-123")
+        
+        # Assert
+        assert result == PATIENT_123
+        assert fhir_client_with_mocks.session.request.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_make_request_with_params(self, fhir_client_with_mocks, create_mock_response):
+    async def test_make_request_with_params(self, fhir_client_with_mocks, fhir_backend):
         """Test _make_request correctly passes query parameters."""
         # Arrange
-        expected_data = bundle_response([patient_response()])
-        mock_response = create_mock_response(200, expected_data)
-        fhir_client_with_mocks.session.request.return_value = mock_response
-        
         params = {"patient": "test-123", "category": "vital-signs", "_count": "10"}
+        # Registered for these params only, so a dropped or altered query string gets a 404
+        fhir_backend.register("GET", "Observation", PATIENT_BUNDLE, params=params)
         
         # Act
         result = await fhir_client_with_mocks._make_request("GET", "Observation", params=params)
         
         # Assert
-        assert result == expected_data
-        call_args = fhir_client_with_mocks.session.request.call_args
-        assert call_args[1]["params"] == params
+        assert result == PATIENT_BUNDLE
+        assert len(fhir_backend.calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_make_request_with_post_data(self, fhir_client_with_mocks, create_mock_response):
+    async def test_make_request_with_post_data(self, fhir_client_with_mocks, fhir_backend):
         """Test _make_request correctly passes POST data."""
         # Arrange
         expected_data = {"resourceType": "Parameters", "parameter": []}
-        mock_response = create_mock_response(200, expected_data)
-        fhir_client_with_mocks.session.request.return_value = mock_response
+        fhir_backend.register("POST", "Patient/$match", expected_data)
         
         post_data = {"resourceType": "Patient", "name": [{"family": "Doe"}]}
         
@@ -147,9 +196,9 @@ class TestFHIRClientMakeRequest:
         
         # Assert
         assert result == expected_data
-        call_args = fhir_client_with_mocks.session.request.call_args
-        assert call_args[1]["method"] == "POST"
-        assert call_args[1]["json"] == post_data
+        [(method, endpoint, kwargs)] = fhir_backend.calls
+        assert (method, endpoint) == ("POST", "Patient/$match")
+        assert kwargs["json"] == post_data
 
 
 class TestFHIRClientBundleHandling:
@@ -158,7 +207,7 @@ class TestFHIRClientBundleHandling:
     def test_get_bundle_entries_success(self, fhir_client_with_mocks):
         """Test successful extraction of entries from FHIR Bundle."""
         # Arrange
-        bundle = bundle_response([patient_response(), patient_response("patient-456")])
+        bundle = TWO_PATIENT_BUNDLE
         
         # Act
         entries = fhir_client_with_mocks._get_bundle_entries(bundle)
@@ -185,7 +234,7 @@ class TestFHIRClientBundleHandling:
     async def test_handle_pagination_single_page(self, fhir_client_with_mocks):
         """Test pagination handling with single page (no next link)."""
         # Arrange
-        bundle = bundle_response([patient_response()])
+        bundle = PATIENT_BUNDLE
         
         # Act
         all_entries = await fhir_client_with_mocks._handle_pagination(bundle)
@@ -198,119 +247,93 @@ class TestFHIRClientBundleHandling:
     async def test_handle_pagination_multiple_pages(self, fhir_client_with_mocks, create_mock_response):
         """Test pagination handling with multiple pages."""
         # Arrange
-        page1_bundle = bundle_response([patient_response("patient-1")])
-        page1_bundle["link"] = [
-            {"relation": "next", "url": "https://fhir.server/Patient?_getpages=page2"}
-        ]
-        
-        page2_bundle = bundle_response([patient_response("patient-2")])
-        
-        # Mock the _make_request for the next page
-        fhir_client_with_mocks._make_request = AsyncMock(return_value=page2_bundle)
-        
-        # Act
-        all_entries = await fhir_client_with_mocks._handle_pagination(page1_bundle)
+        # Mock the _make_request for the next page; patch.object restores it, since the client is shared
+        make_request = _areturn(PAGE2_BUNDLE)
+        with patch.object(fhir_client_with_mocks, '_make_request', make_request):
+            # Act
+            all_entries = await fhir_client_with_mocks._handle_pagination(PAGE1_BUNDLE)
         
         # Assert
         assert len(all_entries) == 2
         assert all_entries[0]["id"] == "patient-1"
         assert all_entries[1]["id"] == "patient-2"
-        fhir_client_with_mocks._make_request.assert_called_once_with(
-            "GET", "https://fhir.server/Patient?_getpages=page2"
-        )
+        assert make_request.calls == [(("GET", NEXT_PAGE_URL), {})]
 
 
 class TestFHIRClientHighLevelMethods:
     """Test high-level FHIR client methods that combine multiple operations."""
 
-    @pytest.mark.asyncio
-    async def test_get_patient_success(self, fhir_client_with_mocks, create_mock_response):
+    pytestmark = pytest.mark.asyncio
+
+    async def test_get_patient_success(self, fhir_client_with_mocks, create_mock_response, monkeypatch):
         """Test successful patient retrieval with demographics."""
         # Arrange
-        patient_data = patient_response()
-        # Create a bundle with height/weight observations
-        height_obs = {"resourceType": "Observation", "id": "height-obs-123", "code": {"coding": [{"system": "http://loinc.org", "code": "8302-2"}]}}
-        weight_obs = {"resourceType": "Observation", "id": "weight-obs-123", "code": {"coding": [{"system": "http://loinc.org", "code": "29463-7"}]}}
-        demographics_bundle = bundle_response([height_obs, weight_obs])
-        
-        # Mock the _make_request method to return specific responses
-        with patch.object(fhir_client_with_mocks, '_make_request', new_callable=AsyncMock) as mock_make_request:
-            mock_make_request.side_effect = [patient_data, demographics_bundle]
+        # The client is shared, so the name/phone/address extractors go through monkeypatch, which undoes them
+        monkeypatch.setattr(fhir_client_with_mocks, "_extract_primary_name", lambda *_: "John Doe")
+        monkeypatch.setattr(fhir_client_with_mocks, "_extract_primary_phone", lambda *_: "+1-555-1234")
+        monkeypatch.setattr(fhir_client_with_mocks, "_extract_primary_address", lambda *_: {
+            "primary_address": "123 Main St",
+            "city": "Anytown",
+            "state": "CA",
+            "postal_code": "12345"
+        })
+        # Patch every collaborator in one flat ExitStack instead of nested with-blocks
+        with ExitStack() as stack:
+            make_request = _aseq(PATIENT, HEIGHT_WEIGHT_BUNDLE)
+            stack.enter_context(patch.object(fhir_client_with_mocks, '_make_request', make_request))
             
-            with patch('app.utils.fhir_utils.extract_patient_demographics') as mock_extract:
-                mock_extract.return_value = {
-                    "names": [{"family": "Doe", "given": ["John"]}],
-                    "telecoms": [{"system": "phone", "value": "+1-555-1234", "use": "home"}],
-                    "gender": "male",
-                    "birth_date": "1980-01-01",
-                    "addresses": [{"line": ["123 Main St"], "city": "Anytown", "state": "CA", "postalCode": "12345"}],
-                    "identifiers": []
-                }
-                
-                with patch('app.utils.fhir_utils.extract_observations_by_loinc') as mock_extract_obs:
-                    mock_extract_obs.return_value = [
-                        {"loinc_code": "8302-2", "value": 175, "unit": "cm"},  # Height
-                        {"loinc_code": "29463-7", "value": 70, "unit": "kg"}   # Weight
-                    ]
-                    
-                    with patch('app.utils.calculations.convert_height_to_cm') as mock_height:
-                        with patch('app.utils.calculations.convert_weight_to_kg') as mock_weight:
-                            mock_height.return_value = 175.0
-                            mock_weight.return_value = 70.0
-                            
-                            with patch.object(fhir_client_with_mocks, '_extract_primary_name') as mock_name:
-                                with patch.object(fhir_client_with_mocks, '_extract_primary_phone') as mock_phone:
-                                    with patch.object(fhir_client_with_mocks, '_extract_primary_address') as mock_address:
-                                        mock_name.return_value = "John Doe"
-                                        mock_phone.return_value = "+1-555-1234"
-                                        mock_address.return_value = {
-                                            "primary_address": "123 Main St",
-                                            "city": "Anytown",
-                                            "state": "CA",
-                                            "postal_code": "12345"
-                                        }
-                                        
-                                        # Act
-                                        result = await fhir_client_with_mocks.get_patient("test-patient-123")
-                                        
-                                        # Assert
-                                        from app.models.patient import PatientResponse
-                                        assert isinstance(result, PatientResponse)
-                                        assert result.id == "test-patient-123"
-                                        assert result.active is True
-                                        assert result.gender == "male"
-                                        assert result.primary_name == "John Doe"
-                                        assert result.primary_phone == "+1-555-1234"
-                                        # Height/weight might be None if observations processing fails in try/catch
-                                        # This is acceptable as the method has error handling
-                                        assert result.age is not None  # Computed field from birth_date
-                                        assert mock_make_request.call_count == 2
+            stack.enter_context(patch('app.utils.fhir_utils.extract_patient_demographics', return_value={
+                "names": [{"family": "Doe", "given": ["John"]}],
+                "telecoms": [{"system": "phone", "value": "+1-555-1234", "use": "home"}],
+                "gender": "male",
+                "birth_date": "1980-01-01",
+                "addresses": [{"line": ["123 Main St"], "city": "Anytown", "state": "CA", "postalCode": "12345"}],
+                "identifiers": []
+            }))
+            stack.enter_context(patch('app.utils.fhir_utils.extract_observations_by_loinc', return_value=[
+                {"loinc_code": "8302-2", "value": 175, "unit": "cm"},  # Height
+                {"loinc_code": "29463-7", "value": 70, "unit": "kg"}   # Weight
+            ]))
+            stack.enter_context(patch('app.utils.calculations.convert_height_to_cm', return_value=175.0))
+            stack.enter_context(patch('app.utils.calculations.convert_weight_to_kg', return_value=70.0))
+            
+            # Act
+            result = await fhir_client_with_mocks.get_patient("test-patient-123")
+            
+            # Assert
+            assert isinstance(result, PatientResponse)
+            assert result.model_dump(include={"id", "active", "gender", "primary_name", "primary_phone"}) == {
+                "id": "test-patient-123",
+                "active": True,
+                "gender": "male",
+                "primary_name": "John Doe",
+                "primary_phone": "+1-555-1234"
+            }
+            # Height/weight might be None if observations processing fails in try/catch
+            # This is acceptable as the method has error handling
+            assert result.age is not None  # Computed field from birth_date
+            assert len(make_request.calls) == 2
 
-    @pytest.mark.asyncio
     async def test_get_vitals_concurrent_fetching(self, fhir_client_with_mocks):
         """Test concurrent fetching of different vital sign types."""
         # Arrange
-        mock_fetch_results = [
+        fetch_vitals = _aseq(
             {"vital_type": "HR", "entries": [], "success": True},
             {"vital_type": "BP", "entries": [], "success": True},
             {"vital_type": "TEMP", "entries": [], "success": True},
-        ]
+        )
         
-        with patch.object(fhir_client_with_mocks, '_fetch_vital_observations') as mock_fetch:
-            mock_fetch.side_effect = mock_fetch_results
-            
+        with patch.object(fhir_client_with_mocks, '_fetch_vital_observations', fetch_vitals):
             with patch.object(fhir_client_with_mocks, '_process_vitals_results') as mock_process:
-                from app.models.vitals import VitalSignsTimeSeries
                 mock_process.return_value = VitalSignsTimeSeries()
                 
                 # Act
                 result = await fhir_client_with_mocks.get_vitals("test-patient-123")
                 
                 # Assert
-                assert mock_fetch.call_count == 6  # All vital types
+                assert len(fetch_vitals.calls) == 6  # All vital types
                 assert result.patient_id == "test-patient-123"
 
-    @pytest.mark.asyncio
     async def test_get_labs_with_category_filter(self, fhir_client_with_mocks):
         """Test lab retrieval with specific category filtering."""
         # Arrange
@@ -321,11 +344,9 @@ class TestFHIRClientHighLevelMethods:
             "success": True
         }
         
-        with patch.object(fhir_client_with_mocks, '_fetch_lab_observations') as mock_fetch:
-            mock_fetch.return_value = mock_fetch_result
-            
+        fetch_labs = _areturn(mock_fetch_result)
+        with patch.object(fhir_client_with_mocks, '_fetch_lab_observations', fetch_labs):
             with patch.object(fhir_client_with_mocks, '_process_lab_results') as mock_process:
-                from app.models.labs import LabResultsData
                 mock_process.return_value = LabResultsData()
                 
                 with patch.object(fhir_client_with_mocks, '_count_total_lab_entries') as mock_count:
@@ -335,22 +356,21 @@ class TestFHIRClientHighLevelMethods:
                     result = await fhir_client_with_mocks.get_labs("test-patient-123", lab_category="CBC")
                     
                     # Assert
-                    assert mock_fetch.call_count == 1  # Only CBC category
+                    assert len(fetch_labs.calls) == 1  # Only CBC category
                     assert result.patient_id == "test-patient-123"
                     assert result.total_entries == 5
 
-    @pytest.mark.asyncio
     async def test_fetch_vital_observations_with_date_range(self, fhir_client_with_mocks, create_mock_response):
         """Test vital observations fetching with date range parameters."""
         # Arrange
         start_date = datetime(2023, 1, 1)
         end_date = datetime(2023, 1, 2)
-        bundle = vitals_bundle_response()
+        bundle = VITALS_BUNDLE
         
         # Mock the _make_request method and _get_bundle_entries
-        with patch.object(fhir_client_with_mocks, '_make_request', new_callable=AsyncMock) as mock_make_request:
+        make_request = _areturn(bundle)
+        with patch.object(fhir_client_with_mocks, '_make_request', make_request):
             with patch.object(fhir_client_with_mocks, '_get_bundle_entries') as mock_get_entries:
-                mock_make_request.return_value = bundle
                 mock_get_entries.return_value = bundle["entry"]
                 
                 # Act
@@ -363,25 +383,22 @@ class TestFHIRClientHighLevelMethods:
                 assert result["vital_type"] == "HR"
                 
                 # Check that date parameters were passed correctly
-                call_args = mock_make_request.call_args
-                params = call_args[1]["params"]
+                params = make_request.calls[-1][1]["params"]
                 assert "date" in params
                 assert "2023-01-01" in params["date"]
 
-    @pytest.mark.asyncio
-    async def test_fetch_lab_observations_error_handling(self, fhir_client_with_mocks):
+    @pytest.mark.usefixtures("disable_fhir_request_retries")
+    async def test_fetch_lab_observations_error_handling(self, fhir_client_with_mocks, fhir_backend):
         """Test error handling in lab observations fetching."""
         # Arrange
-        # Mock the _make_request method to raise an exception
-        with patch.object(fhir_client_with_mocks, '_make_request', new_callable=AsyncMock) as mock_make_request:
-            mock_make_request.side_effect = FHIRException(403, "Access denied")
-            
-            # Act
-            result = await fhir_client_with_mocks._fetch_lab_observations(
-                "test-patient-123", ["6690-2"], None, None, "CBC"
-            )
-            
-            # Assert
-            assert result["success"] is False
-            assert result["lab_category"] == "CBC"
-            assert "Access denied" in result["error"]
\ No newline at end of file
+        fhir_backend.register("GET", "Observation", ERR_403, status=403)
+        
+        # Act
+        result = await fhir_client_with_mocks._fetch_lab_observations(
+            "test-patient-123", ["6690-2"], None, None, "CBC"
+        )
+        
+        # Assert
+        assert result["success"] is False
+        assert result["lab_category"] == "CBC"
+        assert "Access denied" in result["error"]
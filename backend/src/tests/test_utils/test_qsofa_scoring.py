@@ -14,14 +14,11 @@ from app.utils.qsofa_scoring import (
     calculate_cardiovascular_score,
     calculate_cns_score,
     calculate_total_qsofa,
+    calculate_qsofa_total_score,
     collect_qsofa_parameters
 )
 from app.models.qsofa import QsofaParameter, QsofaParameters
 from tests.fixtures.qsofa_test_data import (
-    create_low_risk_patient_data,
-    create_medium_risk_patient_data,
-    create_high_risk_patient_data,
-    create_critical_risk_patient_data,
     EXPECTED_QSOFA_SCORES,
     BOUNDARY_TEST_CASES
 )
@@ -134,77 +131,25 @@ class TestPatientScenarios:
         client._make_request = AsyncMock()
         return client
     
-    def test_low_risk_patient_individual_scores(self):
-        """Test individual component scores for low risk patient"""
-        patient_data = create_low_risk_patient_data()
+    @pytest.mark.parametrize("risk_level", ["low_risk", "medium_risk", "high_risk", "critical_risk"])
+    def test_patient_individual_scores(self, qsofa_patients, risk_level):
+        """Test individual component scores for each patient risk level"""
+        patient_data = qsofa_patients[risk_level]
+        expected = EXPECTED_QSOFA_SCORES[risk_level]
         
         # Test each component score
         respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        assert respiratory.score == EXPECTED_QSOFA_SCORES["low_risk"]["respiratory"]
+        assert respiratory.score == expected["respiratory"]
         
         cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        assert cardiovascular.score == EXPECTED_QSOFA_SCORES["low_risk"]["cardiovascular"]
+        assert cardiovascular.score == expected["cardiovascular"]
         
         cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        assert cns.score == EXPECTED_QSOFA_SCORES["low_risk"]["cns"]
+        assert cns.score == expected["cns"]
         
         # Verify total
         total_score = respiratory.score + cardiovascular.score + cns.score
-        assert total_score == EXPECTED_QSOFA_SCORES["low_risk"]["total"]
-    
-    def test_medium_risk_patient_individual_scores(self):
-        """Test individual component scores for medium risk patient"""
-        patient_data = create_medium_risk_patient_data()
-        
-        # Test each component score
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        assert respiratory.score == EXPECTED_QSOFA_SCORES["medium_risk"]["respiratory"]
-        
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        assert cardiovascular.score == EXPECTED_QSOFA_SCORES["medium_risk"]["cardiovascular"]
-        
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        assert cns.score == EXPECTED_QSOFA_SCORES["medium_risk"]["cns"]
-        
-        # Verify total
-        total_score = respiratory.score + cardiovascular.score + cns.score
-        assert total_score == EXPECTED_QSOFA_SCORES["medium_risk"]["total"]
-    
-    def test_high_risk_patient_individual_scores(self):
-        """Test individual component scores for high risk patient"""
-        patient_data = create_high_risk_patient_data()
-        
-        # Test each component score
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        assert respiratory.score == EXPECTED_QSOFA_SCORES["high_risk"]["respiratory"]
-        
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        assert cardiovascular.score == EXPECTED_QSOFA_SCORES["high_risk"]["cardiovascular"]
-        
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        assert cns.score == EXPECTED_QSOFA_SCORES["high_risk"]["cns"]
-        
-        # Verify total
-        total_score = respiratory.score + cardiovascular.score + cns.score
-        assert total_score == EXPECTED_QSOFA_SCORES["high_risk"]["total"]
-    
-    def test_critical_risk_patient_individual_scores(self):
-        """Test individual component scores for critical risk patient"""
-        patient_data = create_critical_risk_patient_data()
-        
-        # Test each component score
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        assert respiratory.score == EXPECTED_QSOFA_SCORES["critical_risk"]["respiratory"]
-        
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        assert cardiovascular.score == EXPECTED_QSOFA_SCORES["critical_risk"]["cardiovascular"]
-        
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        assert cns.score == EXPECTED_QSOFA_SCORES["critical_risk"]["cns"]
-        
-        # Verify total
-        total_score = respiratory.score + cardiovascular.score + cns.score
-        assert total_score == EXPECTED_QSOFA_SCORES["critical_risk"]["total"]
+        assert total_score == expected["total"]
 
 
 class TestEdgeCases:
@@ -222,6 +167,11 @@ class TestEdgeCases:
         assert score.score == 0  # Default is 120.0, which is >100
         assert "120" in score.interpretation
     
+    def test_total_score_none_values(self):
+        """Test integer total with missing readings (uses defaults)"""
+        assert calculate_qsofa_total_score(None, None, False) == 0
+        assert calculate_qsofa_total_score(None, None, True) == 1
+    
     def test_cns_score_false_status(self):
         """Test CNS score with false altered mental status"""
         score = calculate_cns_score(altered_mental_status=False)
@@ -273,6 +223,7 @@ class TestBoundaryValues:
             score = calculate_respiratory_score(respiratory_rate=test_case["value"])
             assert score.score == test_case["expected_score"], \
                 f"Failed for {test_case['description']}: RR {test_case['value']}"
+            assert f"{test_case['value']:.0f}" in score.interpretation
     
     def test_systolic_bp_boundaries(self):
         """Test systolic blood pressure boundary values"""
@@ -280,6 +231,7 @@ class TestBoundaryValues:
             score = calculate_cardiovascular_score(systolic_bp=test_case["value"])
             assert score.score == test_case["expected_score"], \
                 f"Failed for {test_case['description']}: SBP {test_case['value']}"
+            assert f"{test_case['value']:.0f}" in score.interpretation
     
     def test_gcs_boundaries(self):
         """Test GCS boundary values"""
@@ -293,61 +245,21 @@ class TestBoundaryValues:
 class TestRiskStratification:
     """Test qSOFA risk stratification logic"""
     
-    def test_low_risk_identification(self):
-        """Test identification of low risk patients (qSOFA 0-1)"""
-        patient_data = create_low_risk_patient_data()
-        
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        
-        total_score = respiratory.score + cardiovascular.score + cns.score
-        high_risk = total_score >= 2
-        
-        assert total_score == 0
-        assert not high_risk
-    
-    def test_moderate_risk_identification(self):
-        """Test identification of moderate risk patients (qSOFA 1)"""
-        patient_data = create_medium_risk_patient_data()
-        
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        
-        total_score = respiratory.score + cardiovascular.score + cns.score
-        high_risk = total_score >= 2
-        
-        assert total_score == 1
-        assert not high_risk
-    
-    def test_high_risk_identification(self):
-        """Test identification of high risk patients (qSOFA ≥2)"""
-        patient_data = create_high_risk_patient_data()
-        
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-        
-        total_score = respiratory.score + cardiovascular.score + cns.score
-        high_risk = total_score >= 2
-        
-        assert total_score == 2
-        assert high_risk
-    
-    def test_critical_risk_identification(self):
-        """Test identification of critical risk patients (qSOFA 3)"""
-        patient_data = create_critical_risk_patient_data()
-        
-        respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-        cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-        cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
+    @pytest.mark.parametrize("risk_level", ["low_risk", "medium_risk", "high_risk", "critical_risk"])
+    def test_risk_identification(self, qsofa_patients, risk_level):
+        """Test risk identification: qSOFA ≥2 flags high risk, 0-1 does not"""
+        patient_data = qsofa_patients[risk_level]
+        expected = EXPECTED_QSOFA_SCORES[risk_level]
         
-        total_score = respiratory.score + cardiovascular.score + cns.score
+        total_score = calculate_qsofa_total_score(
+            patient_data.respiratory_rate.value,
+            patient_data.systolic_bp.value,
+            patient_data.altered_mental_status
+        )
         high_risk = total_score >= 2
         
-        assert total_score == 3
-        assert high_risk
+        assert total_score == expected["total"]
+        assert high_risk == expected["high_risk"]
 
 
 @pytest.mark.parametrize("patient_type,expected_total,expected_high_risk", [
@@ -356,30 +268,23 @@ class TestRiskStratification:
     ("high_risk", 2, True),
     ("critical_risk", 3, True)
 ])
-def test_patient_total_scores(patient_type, expected_total, expected_high_risk):
+def test_patient_total_scores(qsofa_patients, patient_type, expected_total, expected_high_risk):
     """Parameterized test for patient total qSOFA scores"""
-    if patient_type == "low_risk":
-        patient_data = create_low_risk_patient_data()
-    elif patient_type == "medium_risk":
-        patient_data = create_medium_risk_patient_data()
-    elif patient_type == "high_risk":
-        patient_data = create_high_risk_patient_data()
-    else:  # critical_risk
-        patient_data = create_critical_risk_patient_data()
+    patient_data = qsofa_patients[patient_type]
     
-    # Calculate all individual scores
-    respiratory = calculate_respiratory_score(patient_data.respiratory_rate.value)
-    cardiovascular = calculate_cardiovascular_score(patient_data.systolic_bp.value)
-    cns = calculate_cns_score(patient_data.altered_mental_status, patient_data.gcs.value)
-    
-    total_score = respiratory.score + cardiovascular.score + cns.score
+    total_score = calculate_qsofa_total_score(
+        patient_data.respiratory_rate.value,
+        patient_data.systolic_bp.value,
+        patient_data.altered_mental_status
+    )
     high_risk = total_score >= 2
     
     assert total_score == expected_total
     assert high_risk == expected_high_risk
 
 
-@pytest.mark.parametrize("respiratory_rate,systolic_bp,gcs,altered_status,expected_score", [
+# respiratory_rate, systolic_bp, gcs, altered_status, expected_score
+QSOFA_COMBINATIONS = [
     (16, 120, 15, False, 0),  # All normal
     (25, 120, 15, False, 1),  # Only tachypnea
     (16, 95, 15, False, 1),   # Only hypotension
@@ -388,12 +293,16 @@ def test_patient_total_scores(patient_type, expected_total, expected_high_risk):
     (25, 120, 12, True, 2),   # Tachypnea + altered mental status
     (16, 95, 12, True, 2),    # Hypotension + altered mental status
     (25, 95, 12, True, 3),    # All abnormal
-])
+]
+
+
+@pytest.mark.parametrize("respiratory_rate,systolic_bp,gcs,altered_status,expected_score", QSOFA_COMBINATIONS)
 def test_qsofa_combinations(respiratory_rate, systolic_bp, gcs, altered_status, expected_score):
     """Test various combinations of qSOFA parameters"""
+    assert calculate_qsofa_total_score(respiratory_rate, systolic_bp, altered_status) == expected_score
+    
+    # The component score objects add up to the same total
     respiratory = calculate_respiratory_score(respiratory_rate)
     cardiovascular = calculate_cardiovascular_score(systolic_bp)
     cns = calculate_cns_score(altered_status, gcs)
-    
-    total_score = respiratory.score + cardiovascular.score + cns.score
-    assert total_score == expected_score
\ No newline at end of file
+    assert respiratory.score + cardiovascular.score + cns.score == expected_score
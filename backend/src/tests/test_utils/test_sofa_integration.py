@@ -15,116 +15,132 @@ from tests.fixtures.sofa_test_data import (
     create_medium_risk_patient_data,
     create_high_risk_patient_data,
     create_critical_risk_patient_data,
+    precomputed_sofa_result,
+    PATIENT_FACTORIES,
     EXPECTED_SCORES
 )
 
 
+@pytest.fixture(scope="module")
+def mock_fhir_client():
+    """Mock FHIR client for integration testing; never called, since parameter collection is patched"""
+    client = AsyncMock()
+    client._make_request = AsyncMock()
+    return client
+
+
+@pytest.fixture(scope="module")
+def _collect_sofa_parameters_patch():
+    """Patch collect_sofa_parameters once for the whole module"""
+    with patch('app.utils.sofa_scoring.collect_sofa_parameters') as mock_collect:
+        yield mock_collect
+
+
+@pytest.fixture(autouse=True)
+def collect_mock(request, _collect_sofa_parameters_patch):
+    """Expose the module-wide collect_sofa_parameters mock as self._collect_mock, reset per test"""
+    _collect_sofa_parameters_patch.reset_mock(return_value=True, side_effect=True)
+    if request.instance is not None:
+        request.instance._collect_mock = _collect_sofa_parameters_patch
+    return _collect_sofa_parameters_patch
+
+
 class TestSofaScoreIntegration:
     """Integration tests for complete SOFA scoring pipeline"""
     
-    @pytest.fixture
-    def mock_fhir_client(self):
-        """Mock FHIR client for integration testing"""
-        client = AsyncMock()
-        client._make_request = AsyncMock()
-        return client
-    
     @pytest.mark.asyncio
     async def test_medium_risk_patient_complete_scoring(self, mock_fhir_client):
         """Test complete SOFA scoring for medium risk patient"""
         patient_data = create_medium_risk_patient_data()
         
-        # Mock the parameter collection to return our test data
-        with patch('app.utils.sofa_scoring.collect_sofa_parameters') as mock_collect:
-            mock_collect.return_value = patient_data
-            
-            # Calculate SOFA score
-            result = await calculate_total_sofa(
-                patient_id=patient_data.patient_id,
-                fhir_client=mock_fhir_client,
-                timestamp=patient_data.timestamp
-            )
-            
-            # Verify result structure
-            assert isinstance(result, SofaScoreResult)
-            assert result.patient_id == patient_data.patient_id
-            assert result.timestamp == patient_data.timestamp
-            
-            # Verify individual organ scores
-            assert result.respiratory_score.score == EXPECTED_SCORES["medium_risk"]["respiratory"]
-            assert result.coagulation_score.score == EXPECTED_SCORES["medium_risk"]["coagulation"]
-            assert result.liver_score.score == EXPECTED_SCORES["medium_risk"]["liver"]
-            assert result.cardiovascular_score.score == EXPECTED_SCORES["medium_risk"]["cardiovascular"]
-            assert result.cns_score.score == EXPECTED_SCORES["medium_risk"]["cns"]
-            assert result.renal_score.score == EXPECTED_SCORES["medium_risk"]["renal"]
-            
-            # Verify total score
-            assert result.total_score == EXPECTED_SCORES["medium_risk"]["total"]
-            
-            # Verify organ system names
-            assert result.respiratory_score.organ_system == "Respiratory"
-            assert result.coagulation_score.organ_system == "Coagulation"
-            assert result.liver_score.organ_system == "Liver"
-            assert result.cardiovascular_score.organ_system == "Cardiovascular"
-            assert result.cns_score.organ_system == "Central Nervous System"
-            assert result.renal_score.organ_system == "Renal"
+        # The patched parameter collection returns our test data
+        self._collect_mock.return_value = patient_data
+        
+        # Calculate SOFA score
+        result = await calculate_total_sofa(
+            patient_id=patient_data.patient_id,
+            fhir_client=mock_fhir_client,
+            timestamp=patient_data.timestamp
+        )
+        
+        # Verify result structure
+        assert isinstance(result, SofaScoreResult)
+        assert result.patient_id == patient_data.patient_id
+        assert result.timestamp == patient_data.timestamp
+        
+        # Verify individual organ scores
+        assert result.respiratory_score.score == EXPECTED_SCORES["medium_risk"]["respiratory"]
+        assert result.coagulation_score.score == EXPECTED_SCORES["medium_risk"]["coagulation"]
+        assert result.liver_score.score == EXPECTED_SCORES["medium_risk"]["liver"]
+        assert result.cardiovascular_score.score == EXPECTED_SCORES["medium_risk"]["cardiovascular"]
+        assert result.cns_score.score == EXPECTED_SCORES["medium_risk"]["cns"]
+        assert result.renal_score.score == EXPECTED_SCORES["medium_risk"]["renal"]
+        
+        # Verify total score
+        assert result.total_score == EXPECTED_SCORES["medium_risk"]["total"]
+        
+        # Verify organ system names
+        assert result.respiratory_score.organ_system == "Respiratory"
+        assert result.coagulation_score.organ_system == "Coagulation"
+        assert result.liver_score.organ_system == "Liver"
+        assert result.cardiovascular_score.organ_system == "Cardiovascular"
+        assert result.cns_score.organ_system == "Central Nervous System"
+        assert result.renal_score.organ_system == "Renal"
     
     @pytest.mark.asyncio
     async def test_high_risk_patient_complete_scoring(self, mock_fhir_client):
         """Test complete SOFA scoring for high risk patient"""
         patient_data = create_high_risk_patient_data()
         
-        with patch('app.utils.sofa_scoring.collect_sofa_parameters') as mock_collect:
-            mock_collect.return_value = patient_data
-            
-            result = await calculate_total_sofa(
-                patient_id=patient_data.patient_id,
-                fhir_client=mock_fhir_client,
-                timestamp=patient_data.timestamp
-            )
-            
-            # Verify high risk scoring
-            assert result.total_score == EXPECTED_SCORES["high_risk"]["total"]
-            assert result.respiratory_score.score == EXPECTED_SCORES["high_risk"]["respiratory"]
-            assert result.coagulation_score.score == EXPECTED_SCORES["high_risk"]["coagulation"]
-            assert result.liver_score.score == EXPECTED_SCORES["high_risk"]["liver"]
-            assert result.cardiovascular_score.score == EXPECTED_SCORES["high_risk"]["cardiovascular"]
-            assert result.cns_score.score == EXPECTED_SCORES["high_risk"]["cns"]
-            assert result.renal_score.score == EXPECTED_SCORES["high_risk"]["renal"]
-            
-            # Verify interpretations contain expected clinical details
-            assert "mechanical ventilation" in result.respiratory_score.interpretation
-            assert "8.0" in result.cardiovascular_score.interpretation  # Dopamine dose
+        self._collect_mock.return_value = patient_data
+        
+        result = await calculate_total_sofa(
+            patient_id=patient_data.patient_id,
+            fhir_client=mock_fhir_client,
+            timestamp=patient_data.timestamp
+        )
+        
+        # Verify high risk scoring
+        assert result.total_score == EXPECTED_SCORES["high_risk"]["total"]
+        assert result.respiratory_score.score == EXPECTED_SCORES["high_risk"]["respiratory"]
+        assert result.coagulation_score.score == EXPECTED_SCORES["high_risk"]["coagulation"]
+        assert result.liver_score.score == EXPECTED_SCORES["high_risk"]["liver"]
+        assert result.cardiovascular_score.score == EXPECTED_SCORES["high_risk"]["cardiovascular"]
+        assert result.cns_score.score == EXPECTED_SCORES["high_risk"]["cns"]
+        assert result.renal_score.score == EXPECTED_SCORES["high_risk"]["renal"]
+        
+        # Verify interpretations contain expected clinical details
+        assert "mechanical ventilation" in result.respiratory_score.interpretation
+        assert "8.0" in result.cardiovascular_score.interpretation  # Dopamine dose
     
     @pytest.mark.asyncio
     async def test_critical_risk_patient_complete_scoring(self, mock_fhir_client):
         """Test complete SOFA scoring for critical risk patient"""
         patient_data = create_critical_risk_patient_data()
         
-        with patch('app.utils.sofa_scoring.collect_sofa_parameters') as mock_collect:
-            mock_collect.return_value = patient_data
-            
-            result = await calculate_total_sofa(
-                patient_id=patient_data.patient_id,
-                fhir_client=mock_fhir_client,
-                timestamp=patient_data.timestamp
-            )
-            
-            # Verify maximum SOFA scoring
-            assert result.total_score == EXPECTED_SCORES["critical_risk"]["total"]
-            assert result.total_score == 24  # Maximum possible SOFA score
-            
-            # Verify all organ systems have maximum scores
-            assert result.respiratory_score.score == 4
-            assert result.coagulation_score.score == 4
-            assert result.liver_score.score == 4
-            assert result.cardiovascular_score.score == 4
-            assert result.cns_score.score == 4
-            assert result.renal_score.score == 4
-            
-            # Verify critical interpretations
-            assert "mechanical ventilation" in result.respiratory_score.interpretation
-            assert "High-dose" in result.cardiovascular_score.interpretation
+        self._collect_mock.return_value = patient_data
+        
+        result = await calculate_total_sofa(
+            patient_id=patient_data.patient_id,
+            fhir_client=mock_fhir_client,
+            timestamp=patient_data.timestamp
+        )
+        
+        # Verify maximum SOFA scoring
+        assert result.total_score == EXPECTED_SCORES["critical_risk"]["total"]
+        assert result.total_score == 24  # Maximum possible SOFA score
+        
+        # Verify all organ systems have maximum scores
+        assert result.respiratory_score.score == 4
+        assert result.coagulation_score.score == 4
+        assert result.liver_score.score == 4
+        assert result.cardiovascular_score.score == 4
+        assert result.cns_score.score == 4
+        assert result.renal_score.score == 4
+        
+        # Verify critical interpretations
+        assert "mechanical ventilation" in result.respiratory_score.interpretation
+        assert "High-dose" in result.cardiovascular_score.interpretation
     
     @pytest.mark.asyncio
     async def test_sofa_scoring_with_data_reliability(self, mock_fhir_client):
@@ -135,33 +151,27 @@ class TestSofaScoreIntegration:
         patient_data.platelets.is_estimated = True
         patient_data.gcs.is_estimated = True
         
-        with patch('app.utils.sofa_scoring.collect_sofa_parameters') as mock_collect:
-            mock_collect.return_value = patient_data
-            
-            result = await calculate_total_sofa(
-                patient_id=patient_data.patient_id,
-                fhir_client=mock_fhir_client,
-                timestamp=patient_data.timestamp
-            )
-            
-            # Verify reliability metrics are included
-            assert hasattr(result, 'data_reliability_score')
-            assert hasattr(result, 'estimated_parameters_count')
-            assert hasattr(result, 'missing_parameters')
-            
-            # Verify estimated parameters are counted
-            assert result.estimated_parameters_count == 2  # platelets and gcs
-            assert result.data_reliability_score < 1.0  # Should be less than perfect
+        self._collect_mock.return_value = patient_data
+        
+        result = await calculate_total_sofa(
+            patient_id=patient_data.patient_id,
+            fhir_client=mock_fhir_client,
+            timestamp=patient_data.timestamp
+        )
+        
+        # Verify reliability metrics are included
+        assert hasattr(result, 'data_reliability_score')
+        assert hasattr(result, 'estimated_parameters_count')
+        assert hasattr(result, 'missing_parameters')
+        
+        # Verify estimated parameters are counted
+        assert result.estimated_parameters_count == 2  # platelets and gcs
+        assert result.data_reliability_score < 1.0  # Should be less than perfect
     
     def test_patient_data_fixture_completeness(self):
         """Test that patient data fixtures contain all required parameters"""
-        test_patients = [
-            create_medium_risk_patient_data(),
-            create_high_risk_patient_data(),
-            create_critical_risk_patient_data()
-        ]
-        
-        for patient_data in test_patients:
+        for patient_factory in PATIENT_FACTORIES.values():
+            patient_data = patient_factory()
             # Verify all critical parameters are present
             assert patient_data.pao2_fio2_ratio.value is not None
             assert patient_data.platelets.value is not None
@@ -180,40 +190,57 @@ class TestSofaScoreIntegration:
             assert patient_data.patient_id is not None
             assert len(patient_data.patient_id) > 0
     
-    @pytest.mark.parametrize("patient_func,expected_total,risk_level", [
-        (create_medium_risk_patient_data, 10, "medium"),
-        (create_high_risk_patient_data, 17, "high"), 
-        (create_critical_risk_patient_data, 24, "critical")
+    def test_precomputed_results_match_expected_scores(self):
+        """Test the cached scenario results against EXPECTED_SCORES without the async pipeline"""
+        for risk_level in PATIENT_FACTORIES:
+            result = precomputed_sofa_result(risk_level)
+            expected = EXPECTED_SCORES[risk_level]
+            
+            assert {
+                "respiratory": result.respiratory_score.score,
+                "coagulation": result.coagulation_score.score,
+                "liver": result.liver_score.score,
+                "cardiovascular": result.cardiovascular_score.score,
+                "cns": result.cns_score.score,
+                "renal": result.renal_score.score,
+                "total": result.total_score
+            } == expected
+    
+    @pytest.mark.parametrize("risk_level,expected_total", [
+        ("medium_risk", 10),
+        ("high_risk", 17),
+        ("critical_risk", 24)
     ])
     @pytest.mark.asyncio
-    async def test_parametrized_sofa_calculations(self, mock_fhir_client, patient_func, expected_total, risk_level):
+    async def test_parametrized_sofa_calculations(self, mock_fhir_client, risk_level, expected_total):
         """Parametrized test for all patient risk levels"""
-        patient_data = patient_func()
+        patient_data = PATIENT_FACTORIES[risk_level]()
         
-        with patch('app.utils.sofa_scoring.collect_sofa_parameters') as mock_collect:
-            mock_collect.return_value = patient_data
-            
-            result = await calculate_total_sofa(
-                patient_id=patient_data.patient_id,
-                fhir_client=mock_fhir_client,
-                timestamp=patient_data.timestamp
-            )
-            
-            assert result.total_score == expected_total
-            assert result.patient_id == patient_data.patient_id
-            
-            # Verify all scores are within valid range (0-4 per organ)
-            organ_scores = [
-                result.respiratory_score.score,
-                result.coagulation_score.score,
-                result.liver_score.score,
-                result.cardiovascular_score.score,
-                result.cns_score.score,
-                result.renal_score.score
-            ]
-            
-            for score in organ_scores:
-                assert 0 <= score <= 4, f"Organ score {score} out of valid range 0-4"
-            
-            # Verify total is sum of individual scores
-            assert result.total_score == sum(organ_scores)
\ No newline at end of file
+        self._collect_mock.return_value = patient_data
+        
+        result = await calculate_total_sofa(
+            patient_id=patient_data.patient_id,
+            fhir_client=mock_fhir_client,
+            timestamp=patient_data.timestamp
+        )
+        
+        # The async pipeline must match the cached synchronous scoring of the same scenario
+        assert result == precomputed_sofa_result(risk_level)
+        assert result.total_score == expected_total
+        assert result.patient_id == patient_data.patient_id
+        
+        # Verify all scores are within valid range (0-4 per organ)
+        organ_scores = [
+            result.respiratory_score.score,
+            result.coagulation_score.score,
+            result.liver_score.score,
+            result.cardiovascular_score.score,
+            result.cns_score.score,
+            result.renal_score.score
+        ]
+        
+        for score in organ_scores:
+            assert 0 <= score <= 4, f"Organ score {score} out of valid range 0-4"
+        
+        # Verify total is sum of individual scores
+        assert result.total_score == sum(organ_scores)
@@ -6,6 +6,7 @@ to validate individual organ system scores and total SOFA calculations.
 """
 
 import pytest
+import numpy as np
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock
 
@@ -17,6 +18,11 @@ from app.utils.sofa_scoring import (
     calculate_cns_score,
     calculate_renal_score,
     calculate_total_sofa,
+    calculate_sofa_from_parameters,
+    calculate_organ_scores_batch,
+    calculate_total_sofa_batch,
+    calculate_coagulation_score_batch,
+    calculate_respiratory_score_batch,
     collect_sofa_parameters
 )
 from app.models.sofa import SofaParameter, VasopressorDoses, SofaParameters
@@ -326,6 +332,13 @@ class TestEdgeCases:
         score = calculate_renal_score(creatinine=None, urine_output_24h=None)
         assert score.score == 0  # Defaults are normal values
     
+    def test_nan_values_score_critical(self):
+        """Test NaN readings fail every threshold and score 4"""
+        nan = float("nan")
+        assert calculate_coagulation_score(platelets=nan).score == 4
+        assert calculate_liver_score(bilirubin=nan).score == 4
+        assert calculate_renal_score(creatinine=nan, urine_output_24h=1500).score == 4
+    
     def test_boundary_values_respiratory(self):
         """Test boundary values for respiratory scoring"""
         # Test exact boundary values
@@ -407,4 +420,102 @@ def test_patient_total_scores(patient_type, expected_total):
     total_score = (respiratory.score + coagulation.score + liver.score + 
                   cardiovascular.score + cns.score + renal.score)
     
-    assert total_score == expected_total
\ No newline at end of file
+    assert total_score == expected_total
+
+def _sofa_parameters(pao2=None, fio2=None, on_ventilation=False, platelets=None, bilirubin=None, map_value=None,
+                     gcs=None, creatinine=None, urine_output_24h=None, **vasopressor_doses):
+    """Build SofaParameters from raw values; anything not given is missing"""
+    return SofaParameters(
+        patient_id="batch-patient",
+        pao2=SofaParameter(value=pao2),
+        fio2=SofaParameter(value=fio2),
+        mechanical_ventilation=on_ventilation,
+        platelets=SofaParameter(value=platelets),
+        bilirubin=SofaParameter(value=bilirubin),
+        map_value=SofaParameter(value=map_value),
+        vasopressor_doses=VasopressorDoses(**vasopressor_doses),
+        gcs=SofaParameter(value=gcs),
+        creatinine=SofaParameter(value=creatinine),
+        urine_output_24h=SofaParameter(value=urine_output_24h)
+    )
+
+
+# One parameter varied per case across its thresholds, plus the all-missing case
+BATCH_BOUNDARY_CASES = (
+    [{}]
+    + [{"pao2": pao2, "fio2": fio2, "on_ventilation": vent}
+       for pao2, fio2 in [(0, 0.5), (80, None), (40, 0.4), (60, 0.3), (90, 0.3), (120, 0.3), (200, 0.5), (70, 0)]
+       for vent in (False, True)]
+    + [{"platelets": value} for value in (19, 20, 49, 50, 99, 100, 149, 150)]
+    + [{"bilirubin": value} for value in (1.1, 1.2, 1.9, 2.0, 5.9, 6.0, 11.9, 12.0)]
+    + [{"map_value": value} for value in (69, 70)]
+    + [{"map_value": 65, "dopamine": dose} for dose in (0, 3, 5, 5.1, 15, 15.1)]
+    + [{"map_value": 65, name: dose} for name in ("epinephrine", "norepinephrine") for dose in (0.1, 0.11)]
+    + [{"gcs": value} for value in (5, 6, 9, 10, 12, 13, 14, 15)]
+    + [{"creatinine": value} for value in (1.1, 1.2, 1.9, 2.0, 3.4, 3.5, 4.9, 5.0)]
+    + [{"urine_output_24h": value} for value in (199, 200, 499, 500)]
+    # NaN readings fail every threshold, as in the scalar ladders
+    + [{name: float("nan")} for name in ("platelets", "bilirubin", "gcs", "creatinine", "urine_output_24h")]
+    + [{"platelets": float("nan"), "bilirubin": float("nan"), "creatinine": float("nan")}]
+)
+
+
+class TestBatchScoring:
+    """Test vectorized batch SOFA scoring against the scalar functions"""
+    
+    def test_batch_totals_for_patient_scenarios(self):
+        """Test one batch call scores all patient scenarios"""
+        patients = [
+            create_medium_risk_patient_data(),
+            create_high_risk_patient_data(),
+            create_critical_risk_patient_data()
+        ]
+        
+        totals = calculate_total_sofa_batch(patients)
+        
+        np.testing.assert_array_equal(totals, [
+            EXPECTED_SCORES["medium_risk"]["total"],
+            EXPECTED_SCORES["high_risk"]["total"],
+            EXPECTED_SCORES["critical_risk"]["total"]
+        ])
+    
+    def test_batch_matches_scalar_scores_at_boundaries(self):
+        """Test batch organ scores equal the scalar scores for every threshold boundary"""
+        patients = [_sofa_parameters(**case) for case in BATCH_BOUNDARY_CASES]
+        
+        organ_scores = calculate_organ_scores_batch(patients)
+        
+        expected = []
+        for patient in patients:
+            result = calculate_sofa_from_parameters(patient, patient.patient_id, datetime(2025, 1, 1))
+            expected.append([
+                result.respiratory_score.score, result.coagulation_score.score, result.liver_score.score,
+                result.cardiovascular_score.score, result.cns_score.score, result.renal_score.score
+            ])
+        np.testing.assert_array_equal(organ_scores, expected)
+    
+    def test_organ_batch_functions_accept_arrays(self):
+        """Test per-organ batch functions on raw arrays"""
+        np.testing.assert_array_equal(
+            calculate_coagulation_score_batch(np.array([np.nan, 150, 100, 50, 20, 19])), [4, 0, 1, 2, 3, 4]
+        )
+        np.testing.assert_array_equal(
+            calculate_respiratory_score_batch(
+                np.array([45, 45, 40, 40]), np.array([0.3, 0.3, 0.5, 0.5]), np.array([False, True, False, True])
+            ),
+            [0, 3, 0, 4]
+        )
+    
+    def test_batch_nan_readings_match_scalar_total(self):
+        """Test NaN platelets, bilirubin and creatinine give the same total in both paths"""
+        nan = float("nan")
+        patient = _sofa_parameters(platelets=nan, bilirubin=nan, creatinine=nan)
+        
+        scalar = calculate_sofa_from_parameters(patient, patient.patient_id, datetime(2025, 1, 1))
+        
+        assert scalar.total_score == 12
+        np.testing.assert_array_equal(calculate_total_sofa_batch([patient]), [scalar.total_score])
+    
+    def test_batch_empty_input(self):
+        """Test batch scoring with no patients"""
+        assert calculate_total_sofa_batch([]).shape == (0,)